@@ -37,9 +37,12 @@
 #endif
 #include <wrp_cae/core/factory/binary_file_assimilator.h>
 
+#include <fcntl.h>
+#include <hermes_shm/io/async_io_factory.h>
+
 #include <algorithm>
 #include <cstring>
-#include <fstream>
+#include <memory>
 #include <vector>
 
 // Include wrp_cte headers after closing any wrp_cae namespace to avoid Method
@@ -49,6 +52,36 @@
 
 namespace wrp_cae::core {
 
+namespace {
+
+/** A chunk read submitted to the async I/O backend but not yet reaped */
+struct PendingRead {
+  hipc::FullPtr<char> buffer_; /**< Shared-memory buffer receiving the data */
+  size_t size_;                /**< Requested number of bytes */
+  hshm::IoToken token_;        /**< Completion token from AsyncIO::Read */
+};
+
+/**
+ * Wait for outstanding reads to finish and release their buffers.
+ * Only used on error paths; yields the thread between polls like the
+ * runtime's other non-coroutine wait loops.
+ * @param file Async I/O handle the reads were submitted to
+ * @param reads Reads in submission order
+ * @param first Index of the first read that has not been reaped yet
+ */
+void DrainPendingReads(hshm::AsyncIO* file, std::vector<PendingRead>& reads,
+                       size_t first) {
+  for (size_t i = first; i < reads.size(); ++i) {
+    hshm::IoResult result;
+    while (!file->IsComplete(reads[i].token_, result)) {
+      HSHM_THREAD_MODEL->Yield();
+    }
+    CHI_IPC->FreeBuffer(reads[i].buffer_);
+  }
+}
+
+}  // namespace
+
 BinaryFileAssimilator::BinaryFileAssimilator(
     std::shared_ptr<wrp_cte::core::Client> cte_client)
     : cte_client_(cte_client) {}
@@ -207,86 +240,79 @@ chi::TaskResume BinaryFileAssimilator::Schedule(const AssimilationCtx& ctx,
        "parallel)",
        total_size, num_chunks, kMaxParallelTasks);
 
-  // Open file for reading
+  // Open file for reading through the async I/O backend chosen by
+  // AsyncIoFactory (NIXL, then io_uring, then libaio, then POSIX AIO) so a
+  // window of chunk reads is in flight at once instead of issuing one
+  // blocking read per chunk
   HLOG(kDebug, "BinaryFileAssimilator: Opening file '{}'", src_path);
-  std::ifstream file(src_path, std::ios::binary);
-  if (!file.is_open()) {
+  std::unique_ptr<hshm::AsyncIO> file =
+      hshm::AsyncIoFactory::Get(static_cast<uint32_t>(kMaxParallelTasks));
+  if (!file || !file->Open(src_path, O_RDONLY, 0)) {
     HLOG(kError, "BinaryFileAssimilator: Failed to open file '{}'", src_path);
     error_code = -7;
     CHI_CO_RETURN;
   }
 
-  // Seek to the starting offset
-  HLOG(kDebug, "BinaryFileAssimilator: Seeking to offset {}", chunk_offset);
-  file.seekg(chunk_offset, std::ios::beg);
-  if (!file.good()) {
-    HLOG(kError,
-         "BinaryFileAssimilator: Failed to seek to offset {} in file '{}'",
-         chunk_offset, src_path);
-    error_code = -8;
-    CHI_CO_RETURN;
-  }
-
   // Process chunks in batches
   HLOG(kDebug, "BinaryFileAssimilator: Starting chunk processing");
   size_t chunk_idx = 0;
   size_t bytes_processed = 0;
   std::vector<chi::Future<wrp_cte::core::PutBlobTask>> active_tasks;
+  std::vector<PendingRead> pending_reads;
+  pending_reads.reserve(kMaxParallelTasks);
 
   while (bytes_processed < total_size) {
-    // Submit tasks up to the parallel limit
-    while (active_tasks.size() < kMaxParallelTasks &&
-           bytes_processed < total_size) {
-      // Calculate chunk size
-      size_t current_chunk_size =
-          std::min(kMaxChunkSize, total_size - bytes_processed);
-
-      // Allocate buffer in shared memory
-      auto buffer_ptr = CHI_IPC->AllocateBuffer(current_chunk_size);
-      char* buffer = buffer_ptr.ptr_;
-
-      // Read chunk from file
-      HLOG(kDebug,
-           "BinaryFileAssimilator: About to read chunk {} ({} bytes) at file "
-           "position {}",
-           chunk_idx, current_chunk_size, file.tellg());
-
-      file.read(buffer, current_chunk_size);
-      std::streamsize bytes_read = file.gcount();
+    // Submit reads for every free slot in the window before waiting on any
+    size_t bytes_submitted = bytes_processed;
+    while (active_tasks.size() + pending_reads.size() < kMaxParallelTasks &&
+           bytes_submitted < total_size) {
+      PendingRead read;
+      read.size_ = std::min(kMaxChunkSize, total_size - bytes_submitted);
+      read.buffer_ = CHI_IPC->AllocateBuffer(read.size_);
+      read.token_ = file->Read(read.buffer_.ptr_, read.size_,
+                               static_cast<off_t>(chunk_offset +
+                                                  bytes_submitted));
+      if (read.token_ == hshm::kInvalidIoToken) {
+        HLOG(kError,
+             "BinaryFileAssimilator: Failed to submit read of chunk {} from "
+             "file '{}'",
+             chunk_idx + pending_reads.size(), src_path);
+        CHI_IPC->FreeBuffer(read.buffer_);
+        DrainPendingReads(file.get(), pending_reads, 0);
+        error_code = -9;
+        CHI_CO_RETURN;
+      }
+      bytes_submitted += read.size_;
+      pending_reads.push_back(read);
+    }
 
-      HLOG(kDebug,
-           "BinaryFileAssimilator: After read - bytes_read={}, eof={}, "
-           "fail={}, bad={}, good={}",
-           bytes_read, file.eof(), file.fail(), file.bad(), file.good());
-
-      if (bytes_read != static_cast<std::streamsize>(current_chunk_size)) {
-        // Check if this is a legitimate short read at end of file
-        if (file.eof() && bytes_read > 0) {
-          // This is OK - we read partial data at the end
-          HLOG(kDebug,
-               "BinaryFileAssimilator: Chunk {} partial read: {} bytes "
-               "(expected {})",
-               chunk_idx, bytes_read, current_chunk_size);
-          current_chunk_size = static_cast<size_t>(bytes_read);
-        } else if (file.fail() || bytes_read == 0) {
-          HLOG(kError,
-               "BinaryFileAssimilator: Failed to read chunk {} from file '{}' "
-               "(bytes_read={}, eof={}, fail={}, bad={})",
-               chunk_idx, src_path, bytes_read, file.eof(), file.fail(),
-               file.bad());
-          HLOG(kError,
-               "BinaryFileAssimilator: File position: {}, bytes_processed: {}, "
-               "total_size: {}",
-               file.tellg(), bytes_processed, total_size);
-          CHI_IPC->FreeBuffer(buffer_ptr);
-          error_code = -9;
-          CHI_CO_RETURN;
-        }
+    // Reap the reads in order and hand each chunk to CTE
+    for (size_t i = 0; i < pending_reads.size(); ++i) {
+      PendingRead& read = pending_reads[i];
+      hshm::IoResult result;
+      while (!file->IsComplete(read.token_, result)) {
+        CHI_CO_AWAIT(chi::yield(10.0));
       }
 
-      HLOG(kDebug,
-           "BinaryFileAssimilator: Read chunk {} successfully ({} bytes)",
-           chunk_idx, bytes_read);
+      size_t current_chunk_size = read.size_;
+      if (result.error_code != 0 || result.bytes_transferred <= 0) {
+        HLOG(kError,
+             "BinaryFileAssimilator: Failed to read chunk {} from file '{}' "
+             "(bytes_read={}, error_code={})",
+             chunk_idx, src_path, result.bytes_transferred, result.error_code);
+        CHI_IPC->FreeBuffer(read.buffer_);
+        DrainPendingReads(file.get(), pending_reads, i + 1);
+        error_code = -9;
+        CHI_CO_RETURN;
+      }
+      if (static_cast<size_t>(result.bytes_transferred) < current_chunk_size) {
+        // Legitimate short read at the end of the file
+        HLOG(kDebug,
+             "BinaryFileAssimilator: Chunk {} partial read: {} bytes "
+             "(expected {})",
+             chunk_idx, result.bytes_transferred, current_chunk_size);
+        current_chunk_size = static_cast<size_t>(result.bytes_transferred);
+      }
 
       // Create blob name with chunk index
       std::string blob_name = "chunk_" + std::to_string(chunk_idx);
@@ -298,19 +324,17 @@ chi::TaskResume BinaryFileAssimilator::Schedule(const AssimilationCtx& ctx,
            blob_name);
 
       // Submit PutBlob task asynchronously
-      HLOG(kDebug,
-           "BinaryFileAssimilator: About to call AsyncPutBlob for chunk {}",
-           chunk_idx);
       auto task =
           cte_client_->AsyncPutBlob(tag_id, blob_name, 0, current_chunk_size,
-                                    buffer_ptr.shm_.template Cast<void>(), 1.0f,
-                                    wrp_cte::core::Context(), 0);
+                                    read.buffer_.shm_.template Cast<void>(),
+                                    1.0f, wrp_cte::core::Context(), 0);
 
       active_tasks.push_back(task);
 
-      bytes_processed += current_chunk_size;
+      bytes_processed += read.size_;
       chunk_idx++;
     }
+    pending_reads.clear();
 
     // Wait for at least one task to complete before continuing
     if (!active_tasks.empty()) {
@@ -351,8 +375,6 @@ chi::TaskResume BinaryFileAssimilator::Schedule(const AssimilationCtx& ctx,
     CHI_IPC->FreeBuffer(task->blob_data_.template Cast<char>());
   }
 
-  file.close();
-
   HLOG(kDebug,
        "BinaryFileAssimilator: Successfully scheduled {} chunks for file '{}' "
        "to tag '{}'",
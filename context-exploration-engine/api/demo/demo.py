@@ -38,13 +38,17 @@ def create_test_file(file_path, size_mb=1):
     pattern += b"\n"
 
     bytes_to_write = size_mb * 1024 * 1024
-    bytes_written = 0
+
+    # Repeat the pattern into one ~1MB block (a whole number of patterns, so
+    # the byte stream is unchanged) and write slices of it without copying
+    block = memoryview(pattern * max(1, (1024 * 1024) // len(pattern)))
 
     with open(file_path, 'wb') as f:
-        while bytes_written < bytes_to_write:
-            chunk_size = min(len(pattern), bytes_to_write - bytes_written)
-            f.write(pattern[:chunk_size])
-            bytes_written += chunk_size
+        remaining = bytes_to_write
+        while remaining > 0:
+            chunk_size = min(len(block), remaining)
+            f.write(block[:chunk_size])
+            remaining -= chunk_size
 
     actual_size = os.path.getsize(file_path)
     print(f"  Created: {actual_size:,} bytes ({actual_size / 1024 / 1024:.2f} MB)")
@@ -116,17 +120,12 @@ def demo_context_retrieve(ctx_interface, tag_name):
 
     if packed_data:
         print(f"✓ Retrieved {len(packed_data)} packed context(s)")
-        total_bytes = sum(len(data) for data in packed_data)
+        total_bytes = sum(map(len, packed_data))
         print(f"  Total data: {total_bytes:,} bytes ({total_bytes / 1024 / 1024:.2f} MB)")
 
         # Show a preview of the data
         if total_bytes > 0:
-            # Handle both bytes and string types
-            first_data = packed_data[0][:100]
-            if isinstance(first_data, bytes):
-                preview = first_data.decode('utf-8', errors='replace')
-            else:
-                preview = first_data
+            preview = packed_data[0][:100].hex(' ')
             print(f"  Preview: {preview}...")
     else:
         print("No data retrieved")
@@ -34,10 +34,17 @@
 #ifndef WRP_CEE_API_CONTEXT_INTERFACE_H_
 #define WRP_CEE_API_CONTEXT_INTERFACE_H_
 
+#include <atomic>
+#include <functional>
+#include <memory>
 #include <string>
 #include <vector>
 #include <wrp_cae/core/factory/assimilation_ctx.h>
 
+namespace wrp_cae::core {
+class Client;
+}  // namespace wrp_cae::core
+
 namespace iowarp {
 
 /**
@@ -64,11 +71,18 @@ public:
    *
    * This method takes a vector of AssimilationCtx objects and calls the CAE
    * ParseOmni function to schedule assimilation tasks for each context.
+   * The bundle is split into batches that are submitted asynchronously and
+   * awaited together, so large bundles are assimilated concurrently. Because
+   * every batch is already in flight, a failing batch does not cancel the
+   * others: the assimilation may be partial, and the first failure code is
+   * returned.
    *
    * @param bundle Vector of AssimilationCtx objects to assimilate
+   * @param batch_size Contexts per ParseOmni task (0 = single task, default: 32)
    * @return 0 on success, non-zero error code on failure
    */
-  int ContextBundle(const std::vector<wrp_cae::core::AssimilationCtx> &bundle);
+  int ContextBundle(const std::vector<wrp_cae::core::AssimilationCtx> &bundle,
+                    unsigned int batch_size = 32);
 
   /**
    * Retrieve the identities of objects matching tag and blob patterns
@@ -85,6 +99,19 @@ public:
                                          const std::string &blob_re,
                                          unsigned int max_results = 0);
 
+  /**
+   * Count the objects matching tag and blob patterns
+   *
+   * Same matching as ContextQuery, but only the number of matches is
+   * returned, so blob names are never materialized or transferred.
+   *
+   * @param tag_re Tag regex pattern to match
+   * @param blob_re Blob regex pattern to match
+   * @return Number of matching blobs (0 if none or on failure)
+   */
+  size_t ContextQueryCount(const std::string &tag_re,
+                           const std::string &blob_re);
+
   /**
    * Retrieve the identities and data of objects matching patterns
    *
@@ -98,7 +125,7 @@ public:
    * @param blob_re Blob regex pattern to match
    * @param max_results Maximum number of blobs to retrieve (0 = unlimited, default: 1024)
    * @param max_context_size Maximum total context size in bytes (default: 256MB)
-   * @param batch_size Number of concurrent AsyncGetBlob operations (default: 32)
+   * @param batch_size Number of concurrent AsyncGetBlob operations (0 is treated as 1, default: 32)
    * @return Vector containing one string with packed binary context data (empty if no data)
    */
   std::vector<std::string> ContextRetrieve(const std::string &tag_re,
@@ -107,6 +134,54 @@ public:
                                             size_t max_context_size = 256 * 1024 * 1024,
                                             unsigned int batch_size = 32);
 
+  /**
+   * Retrieve data of objects matching patterns into a caller-owned buffer
+   *
+   * Same as ContextRetrieve, but the packed data is copied directly into
+   * \p out instead of being returned as a string, so callers that already
+   * own a buffer (e.g. a Python bytearray) avoid an extra copy. The size of
+   * \p out bounds the total context size.
+   *
+   * @param tag_re Tag regex pattern to match
+   * @param blob_re Blob regex pattern to match
+   * @param out Destination buffer for the packed data
+   * @param out_size Size of the destination buffer in bytes
+   * @param offsets Filled with the starting offset of each blob in \p out
+   * @param max_results Maximum number of blobs to retrieve (0 = unlimited, default: 1024)
+   * @param batch_size Number of concurrent AsyncGetBlob operations (0 is treated as 1, default: 32)
+   * @return Number of bytes written to \p out (0 if no data)
+   */
+  size_t ContextRetrieveInto(const std::string &tag_re,
+                             const std::string &blob_re,
+                             char *out,
+                             size_t out_size,
+                             std::vector<size_t> &offsets,
+                             unsigned int max_results = 1024,
+                             unsigned int batch_size = 32);
+
+  /**
+   * Retrieve objects matching patterns one blob at a time
+   *
+   * Blobs are fetched in batches of \p batch_size, and only one batch is held
+   * in memory at a time, so peak memory is bounded by the largest batch
+   * rather than by the total size of all matching data. \p on_blob is called
+   * once per blob, in query order; the data pointer is only valid for the
+   * duration of the call. An exception thrown by \p on_blob stops the
+   * iteration and is rethrown to the caller once in-flight reads finish.
+   *
+   * @param tag_re Tag regex pattern to match
+   * @param blob_re Blob regex pattern to match
+   * @param on_blob Called with each blob's data and size; return false to stop
+   * @param max_results Maximum number of blobs to retrieve (0 = unlimited, default: 1024)
+   * @param batch_size Number of concurrent AsyncGetBlob operations (0 = single batch, default: 32)
+   * @return Number of blobs passed to \p on_blob
+   */
+  size_t ContextRetrieveEach(const std::string &tag_re,
+                             const std::string &blob_re,
+                             const std::function<bool(const char *, size_t)> &on_blob,
+                             unsigned int max_results = 1024,
+                             unsigned int batch_size = 32);
+
   /**
    * Split/splice objects into a new context
    *
@@ -139,7 +214,30 @@ private:
    */
   bool EnsureInitialized();
 
-  bool is_initialized_;  /**< Flag indicating whether the interface is initialized */
+  /**
+   * Query matching blobs and pack their data into a shared-memory buffer
+   *
+   * @param tag_re Tag regex pattern to match
+   * @param blob_re Blob regex pattern to match
+   * @param max_results Maximum number of blobs to retrieve (0 = unlimited)
+   * @param max_context_size Maximum total context size in bytes
+   * @param batch_size Number of concurrent AsyncGetBlob operations (0 is
+   *        treated as 1)
+   * @param offsets If non-null, filled with the starting offset of each blob
+   * @param sink Called once with the packed bytes before the buffer is freed
+   * @return Number of packed bytes (0 if no data or on failure)
+   */
+  size_t PackContext(const std::string &tag_re,
+                     const std::string &blob_re,
+                     unsigned int max_results,
+                     size_t max_context_size,
+                     unsigned int batch_size,
+                     std::vector<size_t> *offsets,
+                     const std::function<void(const char *, size_t)> &sink);
+
+  std::atomic<bool> is_initialized_;  /**< Flag indicating whether the interface is initialized */
+  std::unique_ptr<wrp_cae::core::Client>
+      cae_client_;  /**< CAE client, created on initialization and reused */
 };
 
 }  // namespace iowarp
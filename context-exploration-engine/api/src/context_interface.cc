@@ -36,18 +36,203 @@
 #include <wrp_cte/core/core_client.h>
 #include <wrp_cae/core/constants.h>
 #include <chimaera/chimaera.h>
+#include <algorithm>
+#include <cstring>
+#include <exception>
 #include <iostream>
+#include <mutex>
+#include <unordered_map>
+#include <unordered_set>
+#include <utility>
 #include <hermes_shm/util/logging.h>
 
 namespace iowarp {
 
+namespace {
+
+/**
+ * Frees a shared-memory buffer from the IPC manager when it leaves scope,
+ * so early returns and exceptions cannot leak it
+ */
+class ScopedIpcBuffer {
+ public:
+  /**
+   * Allocate a buffer from the IPC manager
+   * @param ipc_manager IPC manager that owns the buffer
+   * @param size Buffer size in bytes
+   */
+  ScopedIpcBuffer(chi::IpcManager *ipc_manager, size_t size)
+      : ipc_manager_(ipc_manager), buffer_(ipc_manager->AllocateBuffer(size)) {}
+
+  ~ScopedIpcBuffer() {
+    if (!buffer_.IsNull()) {
+      ipc_manager_->FreeBuffer(buffer_);
+    }
+  }
+
+  ScopedIpcBuffer(const ScopedIpcBuffer &) = delete;
+  ScopedIpcBuffer &operator=(const ScopedIpcBuffer &) = delete;
+
+  /** @return The allocated buffer (null if the allocation failed) */
+  const hipc::FullPtr<char> &Get() const { return buffer_; }
+
+ private:
+  chi::IpcManager *ipc_manager_;
+  hipc::FullPtr<char> buffer_;
+};
+
+/**
+ * Resolve the tag IDs of a range of query results, issuing every lookup
+ * for a tag not already in the cache before waiting on any of them
+ * @param cte_client CTE client used for the lookups
+ * @param query_results (tag name, blob name) pairs
+ * @param begin First index of the range
+ * @param end One past the last index of the range
+ * @param tag_ids Cache of resolved IDs (null if the lookup failed)
+ */
+void ResolveTagIds(
+    wrp_cte::core::Client *cte_client,
+    const std::vector<std::pair<std::string, std::string>> &query_results,
+    size_t begin, size_t end,
+    std::unordered_map<std::string, wrp_cte::core::TagId> &tag_ids) {
+  std::vector<const std::string *> tag_names;
+  std::vector<chi::Future<
+      wrp_cte::core::GetOrCreateTagTask<wrp_cte::core::CreateParams>>>
+      tag_tasks;
+  for (size_t i = begin; i < end; ++i) {
+    const std::string &tag_name = query_results[i].first;
+    if (!tag_ids.emplace(tag_name, wrp_cte::core::TagId::GetNull()).second) {
+      continue;
+    }
+    tag_names.push_back(&tag_name);
+    tag_tasks.push_back(cte_client->AsyncGetOrCreateTag(tag_name));
+  }
+  for (size_t i = 0; i < tag_tasks.size(); ++i) {
+    tag_tasks[i].Wait();
+    tag_ids[*tag_names[i]] = tag_tasks[i]->tag_id_;
+  }
+}
+
+/**
+ * Query the blobs matching tag and blob patterns across all nodes
+ * @param cte_client CTE client used for the query
+ * @param tag_re Tag regex pattern to match
+ * @param blob_re Blob regex pattern to match
+ * @param max_results Maximum number of blobs (0 = unlimited)
+ * @return (tag name, blob name) pairs
+ */
+std::vector<std::pair<std::string, std::string>> QueryBlobNames(
+    wrp_cte::core::Client *cte_client, const std::string &tag_re,
+    const std::string &blob_re, unsigned int max_results) {
+  auto query_task = cte_client->AsyncBlobQuery(
+      tag_re, blob_re, max_results, chi::PoolQuery::Broadcast());
+  query_task.Wait();
+
+  // Build pairs from the separate tag_names_ and blob_names_ vectors,
+  // moving the names out of the consumed task rather than copying them
+  std::vector<std::pair<std::string, std::string>> query_results;
+  size_t result_count = std::min(query_task->tag_names_.size(),
+                                 query_task->blob_names_.size());
+  query_results.reserve(result_count);
+  for (size_t i = 0; i < result_count; ++i) {
+    query_results.emplace_back(std::move(query_task->tag_names_[i]),
+                               std::move(query_task->blob_names_[i]));
+  }
+  return query_results;
+}
+
+/**
+ * Look up the sizes of a range of query results, resolving their tags and
+ * issuing every size lookup before waiting on any of them. Blobs whose tag
+ * cannot be resolved or that are empty are skipped.
+ * @param cte_client CTE client used for the lookups
+ * @param query_results (tag name, blob name) pairs
+ * @param begin First index of the range
+ * @param end One past the last index of the range
+ * @param tag_ids Cache of resolved tag IDs, extended in place
+ * @return (query result index, blob size) pairs in query order
+ */
+std::vector<std::pair<size_t, chi::u64>> GetBatchBlobSizes(
+    wrp_cte::core::Client *cte_client,
+    const std::vector<std::pair<std::string, std::string>> &query_results,
+    size_t begin, size_t end,
+    std::unordered_map<std::string, wrp_cte::core::TagId> &tag_ids) {
+  ResolveTagIds(cte_client, query_results, begin, end, tag_ids);
+
+  std::vector<size_t> sized_blobs;
+  std::vector<chi::Future<wrp_cte::core::GetBlobSizeTask>> size_tasks;
+  sized_blobs.reserve(end - begin);
+  size_tasks.reserve(end - begin);
+  for (size_t i = begin; i < end; ++i) {
+    const auto& [tag_name, blob_name] = query_results[i];
+    const wrp_cte::core::TagId &tag_id = tag_ids[tag_name];
+    if (tag_id.IsNull()) {
+      HLOG(kWarning, "Failed to get tag '{}', skipping blob", tag_name);
+      continue;
+    }
+    size_tasks.push_back(cte_client->AsyncGetBlobSize(tag_id, blob_name));
+    sized_blobs.push_back(i);
+  }
+
+  std::vector<std::pair<size_t, chi::u64>> sizes;
+  sizes.reserve(size_tasks.size());
+  for (size_t j = 0; j < size_tasks.size(); ++j) {
+    size_tasks[j].Wait();
+    chi::u64 blob_size = size_tasks[j]->size_;
+    if (blob_size == 0) {
+      HLOG(kWarning, "Blob '{}' has zero size, skipping",
+           query_results[sized_blobs[j]].second);
+      continue;
+    }
+    sizes.emplace_back(sized_blobs[j], blob_size);
+  }
+  return sizes;
+}
+
+/**
+ * Schedule an AsyncGetBlob that reads a whole blob into a shared-memory
+ * buffer at the given offset
+ * @param cte_client CTE client used for the read
+ * @param tag_id Tag containing the blob
+ * @param blob_name Blob to read
+ * @param blob_size Number of bytes to read
+ * @param buffer Destination shared-memory buffer
+ * @param offset Byte offset of the blob within buffer
+ * @return Future for the scheduled read
+ */
+chi::Future<wrp_cte::core::GetBlobTask> GetBlobInto(
+    wrp_cte::core::Client *cte_client, const wrp_cte::core::TagId &tag_id,
+    const std::string &blob_name, chi::u64 blob_size,
+    const hipc::FullPtr<char> &buffer, size_t offset) {
+  hipc::ShmPtr<> blob_buffer_ptr;
+  blob_buffer_ptr.alloc_id_ = buffer.shm_.alloc_id_;
+  blob_buffer_ptr.off_ = buffer.shm_.off_.load() + offset;
+  return cte_client->AsyncGetBlob(tag_id,
+                                  blob_name,
+                                  0,          // offset within blob
+                                  blob_size,  // size to read
+                                  0,          // flags
+                                  blob_buffer_ptr);
+}
+
+}  // namespace
+
 ContextInterface::ContextInterface() : is_initialized_(false) {
   // Lazy initialization - defer Chimaera/CAE/CTE init until first operation
   // This allows object construction without requiring a running runtime
 }
 
 bool ContextInterface::EnsureInitialized() {
-  if (is_initialized_) {
+  if (is_initialized_.load(std::memory_order_acquire)) {
+    return true;
+  }
+
+  // The Python bindings release the GIL, so several threads can get here at
+  // once; the client runtime is process-wide, so one lock serializes every
+  // instance's initialization
+  static std::mutex init_mutex;
+  std::lock_guard<std::mutex> lock(init_mutex);
+  if (is_initialized_.load(std::memory_order_relaxed)) {
     return true;
   }
 
@@ -78,7 +263,12 @@ bool ContextInterface::EnsureInitialized() {
     return false;
   }
 
-  is_initialized_ = true;
+  // Connect to CAE core container using the standard pool ID once, and
+  // reuse the client for every subsequent call
+  cae_client_ =
+      std::make_unique<wrp_cae::core::Client>(wrp_cae::core::kCaePoolId);
+
+  is_initialized_.store(true, std::memory_order_release);
   return true;
 }
 
@@ -87,7 +277,8 @@ ContextInterface::~ContextInterface() {
 }
 
 int ContextInterface::ContextBundle(
-    const std::vector<wrp_cae::core::AssimilationCtx> &bundle) {
+    const std::vector<wrp_cae::core::AssimilationCtx> &bundle,
+    unsigned int batch_size) {
   if (!EnsureInitialized()) {
     HLOG(kError, "ContextInterface failed to initialize");
     return 1;
@@ -99,23 +290,39 @@ int ContextInterface::ContextBundle(
   }
 
   try {
-    // Connect to CAE core container using the standard pool ID
-    wrp_cae::core::Client cae_client(wrp_cae::core::kCaePoolId);
-
-    // Call AsyncParseOmni with vector of contexts and wait for completion
-    auto task = cae_client.AsyncParseOmni(bundle);
-    task.Wait();
+    // Split the bundle into batches and submit every batch before waiting
+    // on any of them, so the runtime assimilates batches concurrently
+    size_t batch = (batch_size == 0) ? bundle.size() : batch_size;
+    std::vector<chi::Future<wrp_cae::core::ParseOmniTask>> tasks;
+    tasks.reserve((bundle.size() + batch - 1) / batch);
+    for (size_t start = 0; start < bundle.size(); start += batch) {
+      size_t end = std::min(start + batch, bundle.size());
+      std::vector<wrp_cae::core::AssimilationCtx> batch_ctxs(
+          bundle.begin() + start, bundle.begin() + end);
+      tasks.push_back(cae_client_->AsyncParseOmni(batch_ctxs));
+    }
 
-    chi::u32 result = task->result_code_;
-    chi::u32 num_tasks_scheduled = task->num_tasks_scheduled_;
+    // Wait for all batches, keeping the first failure code; the other
+    // batches are already running, so their partial results are kept
+    int result = 0;
+    chi::u32 num_tasks_scheduled = 0;
+    for (auto &task : tasks) {
+      task.Wait();
+      num_tasks_scheduled += task->num_tasks_scheduled_;
+      if (task->result_code_ != 0 && result == 0) {
+        HLOG(kError, "ParseOmni failed with result code {}",
+             task->result_code_);
+        result = static_cast<int>(task->result_code_);
+      }
+    }
 
     if (result != 0) {
-      HLOG(kError, "ParseOmni failed with result code {}", result);
-      return static_cast<int>(result);
+      return result;
     }
 
     HLOG(kSuccess, "ContextBundle completed successfully!");
-    HLOG(kInfo, "  Tasks scheduled: {}", num_tasks_scheduled);
+    HLOG(kInfo, "  Tasks scheduled: {} ({} batch(es))", num_tasks_scheduled,
+         tasks.size());
 
     return 0;
 
@@ -151,11 +358,9 @@ std::vector<std::string> ContextInterface::ContextQuery(
         chi::PoolQuery::Broadcast());
     task.Wait();
 
-    // Extract results from task - blob names only
-    std::vector<std::string> results;
-    for (size_t i = 0; i < task->blob_names_.size(); ++i) {
-      results.push_back(task->blob_names_[i]);
-    }
+    // Extract results from task - blob names only. The task is consumed
+    // here, so take ownership of its name vector instead of copying it.
+    std::vector<std::string> results = std::move(task->blob_names_);
 
     return results;
 
@@ -165,93 +370,241 @@ std::vector<std::string> ContextInterface::ContextQuery(
   }
 }
 
+size_t ContextInterface::ContextQueryCount(
+    const std::string &tag_re,
+    const std::string &blob_re) {
+  if (!EnsureInitialized()) {
+    HLOG(kError, "ContextInterface failed to initialize");
+    return 0;
+  }
+
+  try {
+    // Get the CTE client singleton
+    auto* cte_client = WRP_CTE_CLIENT;
+    if (!cte_client) {
+      HLOG(kError, "CTE client not initialized");
+      return 0;
+    }
+
+    // total_blobs_matched_ counts every match regardless of max_blobs, so
+    // cap the returned names at one per node to avoid shipping the list
+    auto task = cte_client->AsyncBlobQuery(
+        tag_re,
+        blob_re,
+        1,  // max_blobs
+        chi::PoolQuery::Broadcast());
+    task.Wait();
+
+    return static_cast<size_t>(task->total_blobs_matched_);
+
+  } catch (const std::exception& e) {
+    HLOG(kError, "Error in ContextQueryCount: {}", e.what());
+    return 0;
+  }
+}
+
 std::vector<std::string> ContextInterface::ContextRetrieve(
     const std::string &tag_re,
     const std::string &blob_re,
     unsigned int max_results,
     size_t max_context_size,
     unsigned int batch_size) {
+  std::vector<std::string> results;
+  PackContext(tag_re, blob_re, max_results, max_context_size, batch_size,
+              nullptr, [&results](const char *data, size_t size) {
+                results.emplace_back(data, size);
+              });
+  return results;
+}
+
+size_t ContextInterface::ContextRetrieveInto(
+    const std::string &tag_re,
+    const std::string &blob_re,
+    char *out,
+    size_t out_size,
+    std::vector<size_t> &offsets,
+    unsigned int max_results,
+    unsigned int batch_size) {
+  offsets.clear();
+  if (out == nullptr || out_size == 0) {
+    HLOG(kError, "ContextRetrieveInto: Output buffer is empty");
+    return 0;
+  }
+  return PackContext(tag_re, blob_re, max_results, out_size, batch_size,
+                     &offsets, [out](const char *data, size_t size) {
+                       std::memcpy(out, data, size);
+                     });
+}
+
+size_t ContextInterface::ContextRetrieveEach(
+    const std::string &tag_re,
+    const std::string &blob_re,
+    const std::function<bool(const char *, size_t)> &on_blob,
+    unsigned int max_results,
+    unsigned int batch_size) {
   if (!EnsureInitialized()) {
     HLOG(kError, "ContextInterface failed to initialize");
-    return std::vector<std::string>();
+    return 0;
   }
 
+  std::exception_ptr callback_error;
   try {
     // Get the CTE client singleton
     auto* cte_client = WRP_CTE_CLIENT;
     if (!cte_client) {
       HLOG(kError, "CTE client not initialized");
-      return std::vector<std::string>();
+      return 0;
     }
 
     // Get IPC manager for buffer allocation
     auto* ipc_manager = CHI_IPC;
     if (!ipc_manager) {
       HLOG(kError, "Chimaera IPC not initialized");
-      return std::vector<std::string>();
+      return 0;
     }
 
-    // Use AsyncBlobQuery to get list of blobs matching the pattern
-    auto query_task = cte_client->AsyncBlobQuery(
-        tag_re,
-        blob_re,
-        max_results,
-        chi::PoolQuery::Broadcast());
-    query_task.Wait();
+    std::vector<std::pair<std::string, std::string>> query_results =
+        QueryBlobNames(cte_client, tag_re, blob_re, max_results);
+    size_t batch = (batch_size == 0) ? query_results.size() : batch_size;
+    std::unordered_map<std::string, wrp_cte::core::TagId> tag_ids;
+    size_t blob_count = 0;
+    bool keep_going = true;
+
+    // Only one batch is resident at a time: its buffer is sized to exactly
+    // the blobs it holds and is freed before the next batch is fetched
+    for (size_t batch_start = 0; keep_going && batch_start < query_results.size();
+         batch_start += batch) {
+      size_t batch_end = std::min(batch_start + batch, query_results.size());
+      std::vector<std::pair<size_t, chi::u64>> sizes = GetBatchBlobSizes(
+          cte_client, query_results, batch_start, batch_end, tag_ids);
+      if (sizes.empty()) {
+        continue;
+      }
+
+      size_t batch_bytes = 0;
+      for (const auto& entry : sizes) {
+        batch_bytes += entry.second;
+      }
+      ScopedIpcBuffer batch_guard(ipc_manager, batch_bytes);
+      const hipc::FullPtr<char> &batch_buffer = batch_guard.Get();
+      if (batch_buffer.IsNull()) {
+        HLOG(kError, "Failed to allocate {} byte batch buffer", batch_bytes);
+        break;
+      }
+
+      std::vector<chi::Future<wrp_cte::core::GetBlobTask>> tasks;
+      std::vector<size_t> offsets;
+      tasks.reserve(sizes.size());
+      offsets.reserve(sizes.size());
+      size_t offset = 0;
+      for (const auto& [index, blob_size] : sizes) {
+        const auto& [tag_name, blob_name] = query_results[index];
+        tasks.push_back(GetBlobInto(cte_client, tag_ids[tag_name], blob_name,
+                                    blob_size, batch_buffer, offset));
+        offsets.push_back(offset);
+        offset += blob_size;
+      }
+
+      // Hand each blob to the caller in query order as it completes
+      for (size_t j = 0; j < tasks.size(); ++j) {
+        tasks[j].Wait();
+        if (!keep_going) {
+          continue;
+        }
+        if (tasks[j]->return_code_ != 0) {
+          HLOG(kWarning, "GetBlob failed for blob '{}'",
+               query_results[sizes[j].first].second);
+          continue;
+        }
+        // A throwing callback stops the iteration, but the rest of the
+        // batch is still drained before its buffer is released
+        try {
+          keep_going = on_blob(batch_buffer.ptr_ + offsets[j], sizes[j].second);
+        } catch (...) {
+          callback_error = std::current_exception();
+          keep_going = false;
+          continue;
+        }
+        ++blob_count;
+      }
+    }
+
+    if (!callback_error) {
+      return blob_count;
+    }
+  } catch (const std::exception& e) {
+    HLOG(kError, "Error in ContextRetrieveEach: {}", e.what());
+    return 0;
+  }
+
+  // Callback errors belong to the caller, so they are not logged and dropped
+  std::rethrow_exception(callback_error);
+}
+
+size_t ContextInterface::PackContext(
+    const std::string &tag_re,
+    const std::string &blob_re,
+    unsigned int max_results,
+    size_t max_context_size,
+    unsigned int batch_size,
+    std::vector<size_t> *offsets,
+    const std::function<void(const char *, size_t)> &sink) {
+  if (!EnsureInitialized()) {
+    HLOG(kError, "ContextInterface failed to initialize");
+    return 0;
+  }
 
-    // Build query_results from separate tag_names_ and blob_names_ vectors
-    std::vector<std::pair<std::string, std::string>> query_results;
-    size_t result_count = std::min(query_task->tag_names_.size(), query_task->blob_names_.size());
-    for (size_t i = 0; i < result_count; ++i) {
-      query_results.emplace_back(query_task->tag_names_[i], query_task->blob_names_[i]);
+  try {
+    // Get the CTE client singleton
+    auto* cte_client = WRP_CTE_CLIENT;
+    if (!cte_client) {
+      HLOG(kError, "CTE client not initialized");
+      return 0;
     }
 
+    // Get IPC manager for buffer allocation
+    auto* ipc_manager = CHI_IPC;
+    if (!ipc_manager) {
+      HLOG(kError, "Chimaera IPC not initialized");
+      return 0;
+    }
+
+    // Get list of blobs matching the pattern
+    std::vector<std::pair<std::string, std::string>> query_results =
+        QueryBlobNames(cte_client, tag_re, blob_re, max_results);
+
     if (query_results.empty()) {
       HLOG(kInfo, "ContextRetrieve: No blobs found matching patterns");
-      return std::vector<std::string>();
+      return 0;
     }
 
     HLOG(kInfo, "ContextRetrieve: Found {} matching blobs", query_results.size());
 
     // Allocate buffer for packed context
-    hipc::FullPtr<char> context_buffer = ipc_manager->AllocateBuffer(max_context_size);
+    ScopedIpcBuffer context_guard(ipc_manager, max_context_size);
+    const hipc::FullPtr<char> &context_buffer = context_guard.Get();
     if (context_buffer.IsNull()) {
       HLOG(kError, "Failed to allocate context buffer");
-      return std::vector<std::string>();
+      return 0;
     }
 
     size_t buffer_offset = 0;  // Current offset in context buffer
-    std::vector<std::string> results;
+    std::unordered_map<std::string, wrp_cte::core::TagId> tag_ids;
+
+    // Process blobs in batches; a zero batch size would never advance
+    size_t batch = std::max<size_t>(batch_size, 1);
+    for (size_t batch_start = 0; batch_start < query_results.size(); batch_start += batch) {
+      size_t batch_end = std::min(batch_start + batch, query_results.size());
 
-    // Process blobs in batches
-    for (size_t batch_start = 0; batch_start < query_results.size(); batch_start += batch_size) {
-      size_t batch_end = std::min(batch_start + batch_size, query_results.size());
-      size_t batch_count = batch_end - batch_start;
+      // Resolve tags and sizes for the whole batch concurrently
+      std::vector<std::pair<size_t, chi::u64>> sizes = GetBatchBlobSizes(
+          cte_client, query_results, batch_start, batch_end, tag_ids);
 
       // Schedule AsyncGetBlob operations for this batch
       std::vector<chi::Future<wrp_cte::core::GetBlobTask>> tasks;
-      tasks.reserve(batch_count);
-
-      for (size_t i = batch_start; i < batch_end; ++i) {
-        const auto& [tag_name, blob_name] = query_results[i];
-
-        // Get or create tag to get tag_id
-        auto tag_task = cte_client->AsyncGetOrCreateTag(tag_name);
-        tag_task.Wait();
-        wrp_cte::core::TagId tag_id = tag_task->tag_id_;
-        if (tag_id.IsNull()) {
-          HLOG(kWarning, "Failed to get tag '{}', skipping blob", tag_name);
-          continue;
-        }
-
-        // Get blob size first
-        auto size_task = cte_client->AsyncGetBlobSize(tag_id, blob_name);
-        size_task.Wait();
-        chi::u64 blob_size = size_task->size_;
-        if (blob_size == 0) {
-          HLOG(kWarning, "Blob '{}' has zero size, skipping", blob_name);
-          continue;
-        }
+      tasks.reserve(sizes.size());
+      for (const auto& [index, blob_size] : sizes) {
+        const auto& [tag_name, blob_name] = query_results[index];
 
         // Check if blob fits in buffer
         if (buffer_offset + blob_size > max_context_size) {
@@ -260,21 +613,11 @@ std::vector<std::string> ContextInterface::ContextRetrieve(
           break;
         }
 
-        // Calculate buffer pointer for this blob
-        hipc::ShmPtr<> blob_buffer_ptr;
-        blob_buffer_ptr.alloc_id_ = context_buffer.shm_.alloc_id_;
-        blob_buffer_ptr.off_ = context_buffer.shm_.off_.load() + buffer_offset;
-
-        // Schedule AsyncGetBlob
-        auto task = cte_client->AsyncGetBlob(
-            tag_id,
-            blob_name,
-            0,              // offset within blob
-            blob_size,      // size to read
-            0,              // flags
-            blob_buffer_ptr);
-
-        tasks.push_back(task);
+        tasks.push_back(GetBlobInto(cte_client, tag_ids[tag_name], blob_name,
+                                    blob_size, context_buffer, buffer_offset));
+        if (offsets) {
+          offsets->push_back(buffer_offset);
+        }
         buffer_offset += blob_size;
       }
 
@@ -290,26 +633,17 @@ std::vector<std::string> ContextInterface::ContextRetrieve(
       // goes out of scope. Manual DelTask here causes a double-free.
     }
 
-    // Convert buffer to std::string
-    std::string packed_context;
+    // Hand the packed bytes to the caller straight from shared memory
     if (buffer_offset > 0) {
-      packed_context.assign(context_buffer.ptr_, buffer_offset);
+      sink(context_buffer.ptr_, buffer_offset);
       HLOG(kSuccess, "ContextRetrieve: Retrieved {} bytes of packed context", buffer_offset);
     }
 
-    // Free the allocated buffer
-    ipc_manager->FreeBuffer(context_buffer);
-
-    // Return the packed context as a vector with single string
-    if (!packed_context.empty()) {
-      results.push_back(packed_context);
-    }
-
-    return results;
+    return buffer_offset;
 
   } catch (const std::exception& e) {
     HLOG(kError, "Error in ContextRetrieve: {}", e.what());
-    return std::vector<std::string>();
+    return 0;
   }
 }
 
@@ -346,9 +680,17 @@ int ContextInterface::ContextDestroy(
       return 1;
     }
 
-    // Iterate over each context name and delete the corresponding tag
+    // Iterate over each context name and delete the corresponding tag,
+    // skipping repeats so a duplicated name is not deleted twice
     int error_count = 0;
+    std::unordered_set<std::string> seen;
+    seen.reserve(context_names.size());
     for (const auto& context_name : context_names) {
+      if (!seen.insert(context_name).second) {
+        HLOG(kWarning, "Context '{}' listed more than once, skipping duplicate",
+             context_name);
+        continue;
+      }
       auto task = cte_client->AsyncDelTag(context_name);
       task.Wait();
       bool result = (task->return_code_ == 0);
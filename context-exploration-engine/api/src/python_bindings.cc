@@ -32,13 +32,138 @@
  */
 
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/pair.h>
 #include <nanobind/stl/string.h>
 #include <nanobind/stl/vector.h>
 #include <wrp_cee/api/context_interface.h>
 #include <wrp_cae/core/factory/assimilation_ctx.h>
 
+#include <exception>
+#include <string>
+
 namespace nb = nanobind;
 
+namespace {
+
+/**
+ * Convert one dict value, naming the key and its owner if the type is wrong
+ * @param value Value read from the dict
+ * @param where Description of the dict for error messages (e.g. "items[2]")
+ * @param key Key the value was read from
+ * @param expected Expected Python type, for error messages
+ * @return The converted value
+ */
+template <typename T>
+T DictValueAs(PyObject *value, const std::string &where, const char *key,
+              const char *expected) {
+  T result;
+  if (value == Py_None ||
+      !nb::try_cast<T>(nb::handle(value), result)) {
+    throw nb::type_error((where + " key '" + key + "' must be " + expected +
+                          ", got " + Py_TYPE(value)->tp_name)
+                             .c_str());
+  }
+  return result;
+}
+
+/**
+ * Read a key from a Python dict, falling back to a default when absent
+ * @param d Source dict
+ * @param where Description of the dict for error messages
+ * @param key Key to look up
+ * @param expected Expected Python type, for error messages
+ * @param default_value Value returned when the key is missing
+ * @return The converted value or default_value
+ */
+template <typename T>
+T DictGetOr(const nb::dict &d, const std::string &where, const char *key,
+            const char *expected, T default_value) {
+  PyObject *item = PyDict_GetItemString(d.ptr(), key);
+  return item ? DictValueAs<T>(item, where, key, expected)
+              : std::move(default_value);
+}
+
+/**
+ * Build an AssimilationCtx from a dict with the same keys as its fields
+ * @param obj Dict with required "src"/"dst" and optional remaining fields
+ * @param where Description of the dict for error messages (e.g. "items[2]")
+ * @return The populated context
+ */
+wrp_cae::core::AssimilationCtx AssimilationCtxFromDict(
+    nb::handle obj, const std::string &where = "AssimilationCtx dict") {
+  if (!PyDict_Check(obj.ptr())) {
+    throw nb::type_error((where + " must be a dict, got " +
+                          Py_TYPE(obj.ptr())->tp_name)
+                             .c_str());
+  }
+  nb::dict d = nb::borrow<nb::dict>(obj);
+  for (const char *key : {"src", "dst"}) {
+    if (!PyDict_GetItemString(d.ptr(), key)) {
+      throw nb::key_error((where + " requires '" + key + "'").c_str());
+    }
+  }
+  return wrp_cae::core::AssimilationCtx(
+      DictGetOr<std::string>(d, where, "src", "str", ""),
+      DictGetOr<std::string>(d, where, "dst", "str", ""),
+      DictGetOr<std::string>(d, where, "format", "str", "binary"),
+      DictGetOr<std::string>(d, where, "depends_on", "str", ""),
+      DictGetOr<size_t>(d, where, "range_off", "a non-negative int", 0),
+      DictGetOr<size_t>(d, where, "range_size", "a non-negative int", 0),
+      DictGetOr<std::string>(d, where, "src_token", "str", ""),
+      DictGetOr<std::string>(d, where, "dst_token", "str", ""));
+}
+
+/**
+ * Build a bundle from parallel per-field lists (structure of arrays)
+ * @param srcs Source URLs, one per context
+ * @param dsts Destination URLs (same length as srcs)
+ * @param formats Data formats (same length as srcs)
+ * @param depends_on Dependencies (same length as srcs, or empty for none)
+ * @param range_offs Byte offsets (same length as srcs, or empty for 0)
+ * @param range_sizes Byte counts (same length as srcs, or empty for 0)
+ * @param src_tokens Source tokens (same length as srcs, or empty for none)
+ * @param dst_tokens Destination tokens (same length as srcs, or empty)
+ * @return One AssimilationCtx per entry of srcs
+ */
+std::vector<wrp_cae::core::AssimilationCtx> BundleFromColumns(
+    const std::vector<std::string> &srcs, const std::vector<std::string> &dsts,
+    const std::vector<std::string> &formats,
+    const std::vector<std::string> &depends_on,
+    const std::vector<size_t> &range_offs,
+    const std::vector<size_t> &range_sizes,
+    const std::vector<std::string> &src_tokens,
+    const std::vector<std::string> &dst_tokens) {
+  size_t n = srcs.size();
+  auto check = [n](size_t size, const char *name, bool optional) {
+    if (size != n && !(optional && size == 0)) {
+      throw nb::value_error(
+          (std::string(name) + " must have the same length as srcs").c_str());
+    }
+  };
+  check(dsts.size(), "dsts", false);
+  check(formats.size(), "formats", false);
+  check(depends_on.size(), "depends_on", true);
+  check(range_offs.size(), "range_offs", true);
+  check(range_sizes.size(), "range_sizes", true);
+  check(src_tokens.size(), "src_tokens", true);
+  check(dst_tokens.size(), "dst_tokens", true);
+
+  std::vector<wrp_cae::core::AssimilationCtx> bundle;
+  bundle.reserve(n);
+  for (size_t i = 0; i < n; ++i) {
+    bundle.emplace_back(srcs[i], dsts[i], formats[i],
+                        depends_on.empty() ? std::string() : depends_on[i],
+                        range_offs.empty() ? 0 : range_offs[i],
+                        range_sizes.empty() ? 0 : range_sizes[i],
+                        src_tokens.empty() ? std::string() : src_tokens[i],
+                        dst_tokens.empty() ? std::string() : dst_tokens[i]);
+  }
+  return bundle;
+}
+
+}  // namespace
+
 NB_MODULE(wrp_cee, m) {
   m.doc() = "IOWarp Context Exploration Engine API - Python Bindings";
 
@@ -69,25 +194,104 @@ NB_MODULE(wrp_cee, m) {
             "Authentication token for source")
     .def_rw("dst_token", &wrp_cae::core::AssimilationCtx::dst_token,
             "Authentication token for destination")
+    .def_static("from_dict",
+                [](const nb::dict &d) { return AssimilationCtxFromDict(d); },
+                nb::arg("d"),
+                "Build an AssimilationCtx from a dict keyed by field name\n\n"
+                "'src' and 'dst' are required; 'format' defaults to 'binary'\n"
+                "and the remaining fields default as in the constructor.\n"
+                "Raises KeyError for a missing required key and TypeError for\n"
+                "a value of the wrong type (including None).")
+    .def_static("from_dict_list",
+                [](const nb::list &items) {
+                  std::vector<wrp_cae::core::AssimilationCtx> ctxs;
+                  ctxs.reserve(nb::len(items));
+                  size_t index = 0;
+                  for (nb::handle item : items) {
+                    ctxs.push_back(AssimilationCtxFromDict(
+                        item, "items[" + std::to_string(index++) + "]"));
+                  }
+                  return ctxs;
+                },
+                nb::arg("items"),
+                "Build a list of AssimilationCtx from a list of dicts in one call\n\n"
+                "Each dict is interpreted as in from_dict; errors name the\n"
+                "offending item index and key.")
     .def("__repr__", [](const wrp_cae::core::AssimilationCtx& ctx) {
       return "<AssimilationCtx src='" + ctx.src + "' dst='" + ctx.dst +
              "' format='" + ctx.format + "'>";
     });
 
   // Bind ContextInterface class
-  // C++ uses PascalCase (Google style), Python exposes snake_case
+  // C++ uses PascalCase (Google style), Python exposes snake_case.
+  // Calls into the runtime release the GIL so other Python threads (e.g.
+  // concurrent MCP tool calls) run while they block; results are converted
+  // to Python objects after the GIL is reacquired.
   nb::class_<iowarp::ContextInterface>(m, "ContextInterface",
       "High-level API for context exploration and management")
     .def(nb::init<>(),
          "Default constructor - initializes the interface")
-    .def("context_bundle", &iowarp::ContextInterface::ContextBundle,
-         nb::arg("bundle"),
+    .def("context_bundle",
+         [](iowarp::ContextInterface &self,
+            const std::vector<wrp_cae::core::AssimilationCtx> &bundle,
+            unsigned int batch_size) {
+           nb::gil_scoped_release release;
+           return self.ContextBundle(bundle, batch_size);
+         },
+         nb::arg("bundle"), nb::arg("batch_size") = 32,
          "Bundle a group of related objects together and assimilate them\n\n"
+         "The bundle is split into batches that are submitted asynchronously\n"
+         "and awaited together.\n\n"
+         "Parameters:\n"
+         "  bundle: List of AssimilationCtx objects to assimilate\n"
+         "  batch_size: Contexts per assimilation task (0 = single task, default: 32)\n\n"
+         "Returns:\n"
+         "  0 on success, non-zero error code on failure")
+    .def("context_bundle_soa",
+         [](iowarp::ContextInterface &self,
+            const std::vector<std::string> &srcs,
+            const std::vector<std::string> &dsts,
+            const std::vector<std::string> &formats,
+            const std::vector<std::string> &depends_on,
+            const std::vector<size_t> &range_offs,
+            const std::vector<size_t> &range_sizes,
+            const std::vector<std::string> &src_tokens,
+            const std::vector<std::string> &dst_tokens,
+            unsigned int batch_size) {
+           std::vector<wrp_cae::core::AssimilationCtx> bundle =
+               BundleFromColumns(srcs, dsts, formats, depends_on, range_offs,
+                                 range_sizes, src_tokens, dst_tokens);
+           nb::gil_scoped_release release;
+           return self.ContextBundle(bundle, batch_size);
+         },
+         nb::arg("srcs"), nb::arg("dsts"), nb::arg("formats"),
+         nb::arg("depends_on") = std::vector<std::string>(),
+         nb::arg("range_offs") = std::vector<size_t>(),
+         nb::arg("range_sizes") = std::vector<size_t>(),
+         nb::arg("src_tokens") = std::vector<std::string>(),
+         nb::arg("dst_tokens") = std::vector<std::string>(),
+         nb::arg("batch_size") = 32,
+         "Bundle objects described as parallel per-field lists\n\n"
+         "Equivalent to context_bundle, but takes one list per AssimilationCtx\n"
+         "field instead of a list of AssimilationCtx objects, so the whole\n"
+         "bundle crosses into C++ in one conversion.\n\n"
          "Parameters:\n"
-         "  bundle: List of AssimilationCtx objects to assimilate\n\n"
+         "  srcs, dsts, formats: Required fields, one entry per context\n"
+         "  depends_on, range_offs, range_sizes, src_tokens, dst_tokens:\n"
+         "    Optional fields; same length as srcs, or empty for defaults\n"
+         "  batch_size: Contexts per assimilation task (0 = single task, default: 32)\n\n"
          "Returns:\n"
          "  0 on success, non-zero error code on failure")
-    .def("context_query", &iowarp::ContextInterface::ContextQuery,
+    .def("context_query",
+         [](iowarp::ContextInterface &self, const std::string &tag_re,
+            const std::string &blob_re, unsigned int max_results) {
+           std::vector<std::string> results;
+           {
+             nb::gil_scoped_release release;
+             results = self.ContextQuery(tag_re, blob_re, max_results);
+           }
+           return results;
+         },
          nb::arg("tag_re"), nb::arg("blob_re"), nb::arg("max_results") = 0,
          "Retrieve the identities of objects matching tag and blob patterns\n\n"
          "Parameters:\n"
@@ -96,7 +300,55 @@ NB_MODULE(wrp_cee, m) {
          "  max_results: Maximum number of results to return (0 = unlimited, default: 0)\n\n"
          "Returns:\n"
          "  List of matching blob names")
-    .def("context_retrieve", &iowarp::ContextInterface::ContextRetrieve,
+    .def("context_query_count",
+         [](iowarp::ContextInterface &self, const std::string &tag_re,
+            const std::string &blob_re) {
+           nb::gil_scoped_release release;
+           return self.ContextQueryCount(tag_re, blob_re);
+         },
+         nb::arg("tag_re"), nb::arg("blob_re"),
+         "Count the objects matching tag and blob patterns\n\n"
+         "Blob names are not materialized, so this is cheaper than\n"
+         "len(context_query(...)) for large result sets.\n\n"
+         "Parameters:\n"
+         "  tag_re: Tag regex pattern to match\n"
+         "  blob_re: Blob regex pattern to match\n\n"
+         "Returns:\n"
+         "  Number of matching blobs")
+    .def("context_query_any",
+         [](iowarp::ContextInterface &self, const std::string &tag_re,
+            const std::string &blob_re) {
+           nb::gil_scoped_release release;
+           return self.ContextQueryCount(tag_re, blob_re) > 0;
+         },
+         nb::arg("tag_re"), nb::arg("blob_re"),
+         "Check whether any object matches tag and blob patterns\n\n"
+         "Parameters:\n"
+         "  tag_re: Tag regex pattern to match\n"
+         "  blob_re: Blob regex pattern to match\n\n"
+         "Returns:\n"
+         "  True if at least one blob matches")
+    .def("context_retrieve",
+         [](iowarp::ContextInterface &self, const std::string &tag_re,
+            const std::string &blob_re, unsigned int max_results,
+            size_t max_context_size, unsigned int batch_size) {
+           if (batch_size == 0) {
+             throw nb::value_error("batch_size must be at least 1");
+           }
+           // Return bytes rather than str so binary data is not decoded
+           std::vector<std::string> packed;
+           {
+             nb::gil_scoped_release release;
+             packed = self.ContextRetrieve(tag_re, blob_re, max_results,
+                                           max_context_size, batch_size);
+           }
+           std::vector<nb::bytes> results;
+           results.reserve(packed.size());
+           for (const std::string &data : packed) {
+             results.emplace_back(data.data(), data.size());
+           }
+           return results;
+         },
          nb::arg("tag_re"), nb::arg("blob_re"),
          nb::arg("max_results") = 1024,
          nb::arg("max_context_size") = 256 * 1024 * 1024,
@@ -109,9 +361,96 @@ NB_MODULE(wrp_cee, m) {
          "  blob_re: Blob regex pattern to match\n"
          "  max_results: Max number of blobs (0=unlimited, default: 1024)\n"
          "  max_context_size: Max total size in bytes (default: 256MB)\n"
-         "  batch_size: Concurrent AsyncGetBlob operations (default: 32)\n\n"
+         "  batch_size: Concurrent AsyncGetBlob operations, at least 1\n"
+         "    (default: 32)\n\n"
+         "Returns:\n"
+         "  List with one bytes object containing packed binary context data (empty if none)")
+    .def("context_retrieve_into",
+         [](iowarp::ContextInterface &self, const std::string &tag_re,
+            const std::string &blob_re,
+            nb::ndarray<uint8_t, nb::ndim<1>, nb::c_contig, nb::device::cpu> out,
+            unsigned int max_results, unsigned int batch_size) {
+           if (batch_size == 0) {
+             throw nb::value_error("batch_size must be at least 1");
+           }
+           std::vector<size_t> offsets;
+           size_t written;
+           {
+             nb::gil_scoped_release release;
+             written = self.ContextRetrieveInto(
+                 tag_re, blob_re, reinterpret_cast<char *>(out.data()),
+                 out.size(), offsets, max_results, batch_size);
+           }
+           return std::make_pair(written, std::move(offsets));
+         },
+         nb::arg("tag_re"), nb::arg("blob_re"), nb::arg("out"),
+         nb::arg("max_results") = 1024, nb::arg("batch_size") = 32,
+         "Retrieve data of objects matching patterns into a writable buffer\n\n"
+         "Packs blob data directly into `out` (e.g. a bytearray or memoryview)\n"
+         "instead of returning a new bytes object. The GIL is released while\n"
+         "data is copied.\n\n"
+         "Parameters:\n"
+         "  tag_re: Tag regex pattern to match\n"
+         "  blob_re: Blob regex pattern to match\n"
+         "  out: Writable contiguous byte buffer; its size bounds the context size\n"
+         "  max_results: Max number of blobs (0=unlimited, default: 1024)\n"
+         "  batch_size: Concurrent AsyncGetBlob operations, at least 1\n"
+         "    (default: 32)\n\n"
+         "Returns:\n"
+         "  Tuple of (bytes written, list of per-blob start offsets in out)")
+    .def("context_retrieve_each",
+         [](iowarp::ContextInterface &self, const std::string &tag_re,
+            const std::string &blob_re, nb::callable callback,
+            unsigned int max_results, unsigned int batch_size) {
+           // Any exception raised by the callback is stashed and re-raised
+           // once the GIL is held again, instead of unwinding through C++
+           std::exception_ptr error;
+           size_t count;
+           {
+             nb::gil_scoped_release release;
+             count = self.ContextRetrieveEach(
+                 tag_re, blob_re,
+                 [&callback, &error](const char *data, size_t size) {
+                   nb::gil_scoped_acquire acquire;
+                   try {
+                     nb::object keep_going = callback(nb::bytes(data, size));
+                     if (keep_going.is_none()) {
+                       return true;
+                     }
+                     int truth = PyObject_IsTrue(keep_going.ptr());
+                     if (truth < 0) {
+                       throw nb::python_error();
+                     }
+                     return truth != 0;
+                   } catch (...) {
+                     error = std::current_exception();
+                     return false;
+                   }
+                 },
+                 max_results, batch_size);
+           }
+           if (error) {
+             std::rethrow_exception(error);
+           }
+           return count;
+         },
+         nb::arg("tag_re"), nb::arg("blob_re"), nb::arg("callback"),
+         nb::arg("max_results") = 1024, nb::arg("batch_size") = 32,
+         "Retrieve objects matching patterns one blob at a time\n\n"
+         "Calls callback(data: bytes) for each matching blob in query order.\n"
+         "Only one batch of blobs is held in memory at a time, so this suits\n"
+         "results too large to materialize at once. The callback's return\n"
+         "value is judged by truthiness: None or a truthy value continues,\n"
+         "any other falsy value stops early. Exceptions raised by the\n"
+         "callback stop the iteration and propagate to the caller.\n\n"
+         "Parameters:\n"
+         "  tag_re: Tag regex pattern to match\n"
+         "  blob_re: Blob regex pattern to match\n"
+         "  callback: Called with each blob's data as bytes\n"
+         "  max_results: Max number of blobs (0=unlimited, default: 1024)\n"
+         "  batch_size: Blobs fetched concurrently per batch (default: 32)\n\n"
          "Returns:\n"
-         "  List with one string containing packed binary context data (empty if none)")
+         "  Number of blobs passed to callback")
     .def("context_splice", &iowarp::ContextInterface::ContextSplice,
          nb::arg("new_ctx"), nb::arg("tag_re"), nb::arg("blob_re"),
          "Split/splice objects into a new context (NOT YET IMPLEMENTED)\n\n"
@@ -121,7 +460,12 @@ NB_MODULE(wrp_cee, m) {
          "  blob_re: Blob regex pattern to match for source objects\n\n"
          "Returns:\n"
          "  0 on success, non-zero error code on failure")
-    .def("context_destroy", &iowarp::ContextInterface::ContextDestroy,
+    .def("context_destroy",
+         [](iowarp::ContextInterface &self,
+            const std::vector<std::string> &context_names) {
+           nb::gil_scoped_release release;
+           return self.ContextDestroy(context_names);
+         },
          nb::arg("context_names"),
          "Destroy contexts by name\n\n"
          "Parameters:\n"
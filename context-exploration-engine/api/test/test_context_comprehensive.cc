@@ -338,6 +338,26 @@ TEST_CASE("CEE - ContextBundle Multiple Files", "[cee][bundle][multi]") {
   INFO("Successfully bundled " << bundle.size() << " contexts");
 }
 
+TEST_CASE("CEE - ContextBundle With Batch Size", "[cee][bundle][batch]") {
+  CEEComprehensiveFixture fixture;
+  fixture.SetupTestData();
+
+  ContextInterface ctx_interface;
+
+  std::string src_url = "file::" + fixture.test_binary_file_;
+
+  std::vector<wrp_cae::core::AssimilationCtx> bundle;
+  bundle.emplace_back(src_url, "iowarp::cee_batch_bundle_1", "binary");
+  bundle.emplace_back(src_url, "iowarp::cee_batch_bundle_2", "binary");
+  bundle.emplace_back(src_url, "iowarp::cee_batch_bundle_3", "binary");
+
+  // One context per batch: three concurrent ParseOmni tasks
+  REQUIRE(ctx_interface.ContextBundle(bundle, 1) == 0);
+
+  // Zero batch size submits the whole bundle as a single task
+  REQUIRE(ctx_interface.ContextBundle(bundle, 0) == 0);
+}
+
 TEST_CASE("CEE - ContextBundle With Range", "[cee][bundle][range]") {
   CEEComprehensiveFixture fixture;
   fixture.SetupTestData();
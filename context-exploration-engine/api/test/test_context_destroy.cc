@@ -37,13 +37,15 @@
  * This test validates the ContextDestroy API by:
  * 1. Testing empty context list handling
  * 2. Testing non-existent context handling
- * 3. Testing special characters in context names
+ * 3. Testing that a duplicated context name is destroyed once
+ * 4. Testing special characters in context names
  *
  * Environment Variables:
  * - INIT_CHIMAERA: If set to "1", initializes Chimaera runtime
  */
 
 #include <wrp_cee/api/context_interface.h>
+#include <wrp_cte/core/core_client.h>
 #include <chimaera/chimaera.h>
 #include <iostream>
 #include <cassert>
@@ -85,6 +87,37 @@ void test_nonexistent_context() {
   HLOG(kSuccess, "PASSED: Non-existent context test");
 }
 
+/**
+ * Test that context_destroy deletes a context listed twice exactly once
+ */
+void test_duplicate_contexts() {
+  HLOG(kInfo, "TEST: Duplicate contexts");
+
+  iowarp::ContextInterface ctx_interface;
+  const std::string context_name = "duplicate_context_12345";
+
+  // Create a real tag so there is something to destroy
+  bool cte_ready = wrp_cte::core::WRP_CTE_CLIENT_INIT();
+  assert(cte_ready && "CTE client should initialize");
+  (void)cte_ready;
+  auto *cte_client = WRP_CTE_CLIENT;
+  auto create_task = cte_client->AsyncGetOrCreateTag(context_name);
+  create_task.Wait();
+  assert(create_task->return_code_ == 0 && "Tag creation should succeed");
+
+  // The repeat is skipped, so the second name does not fail on a
+  // tag that the first one already deleted
+  int result = ctx_interface.ContextDestroy({context_name, context_name});
+  assert(result == 0 && "Destroying a duplicated context should succeed");
+  (void)result;
+
+  auto query_task = cte_client->AsyncTagQuery(context_name);
+  query_task.Wait();
+  assert(query_task->results_.empty() && "Destroyed tag should be gone");
+
+  HLOG(kSuccess, "PASSED: Duplicate contexts test");
+}
+
 /**
  * Test that context_destroy handles special characters
  */
@@ -133,6 +166,8 @@ int main(int argc, char** argv) {
 
     test_nonexistent_context();
 
+    test_duplicate_contexts();
+
     test_special_characters();
 
     HLOG(kSuccess, "All tests PASSED!");
@@ -72,6 +72,35 @@ def test_assimilation_ctx_construction():
         )
         print("  ✅ Partial constructor works")
 
+        # Test dict construction (single and batched)
+        ctx4 = cee.AssimilationCtx.from_dict(
+            {"src": "file::/tmp/test.bin", "dst": "iowarp::test_tag",
+             "range_size": 1024}
+        )
+        assert ctx4.format == "binary" and ctx4.range_size == 1024
+        ctxs = cee.AssimilationCtx.from_dict_list(
+            [{"src": "file::/a.bin", "dst": "iowarp::a"},
+             {"src": "file::/b.h5", "dst": "iowarp::b", "format": "hdf5"}]
+        )
+        assert [c.format for c in ctxs] == ["binary", "hdf5"]
+        print("  ✅ Dict construction works")
+
+        # Malformed entries name the offending index and key
+        bad_inputs = [
+            ([{"src": "file::/a.bin", "dst": "iowarp::a"}, "not a dict"],
+             TypeError, "items[1]"),
+            ([{"src": "file::/a.bin", "dst": None}], TypeError, "'dst'"),
+            ([{"src": "file::/a.bin"}], KeyError, "'dst'"),
+        ]
+        for items, error_type, expected in bad_inputs:
+            try:
+                cee.AssimilationCtx.from_dict_list(items)
+            except error_type as e:
+                assert expected in str(e), f"{expected} not in {e}"
+            else:
+                raise AssertionError(f"from_dict_list accepted {items!r}")
+        print("  ✅ Malformed dicts raise descriptive errors")
+
         return True
     except Exception as e:
         print(f"  ❌ AssimilationCtx construction failed: {e}")
@@ -228,6 +257,25 @@ def test_context_bundle_with_data():
             result = ctx_interface.context_bundle(bundle)
             print(f"  ✅ context_bundle returned: {result}")
 
+            # Same bundle as parallel per-field lists
+            result_soa = ctx_interface.context_bundle_soa(
+                [f"file::{temp_file}"], ["iowarp::python_test_bundle"],
+                ["binary"]
+            )
+            assert result_soa == result, \
+                f"context_bundle_soa returned {result_soa}, expected {result}"
+            print(f"  ✅ context_bundle_soa returned: {result_soa}")
+
+            # Columns of different lengths are rejected before any work
+            try:
+                ctx_interface.context_bundle_soa(
+                    [f"file::{temp_file}"], [], ["binary"])
+            except ValueError:
+                print("  ✅ context_bundle_soa rejected mismatched lengths")
+            else:
+                raise AssertionError(
+                    "context_bundle_soa accepted mismatched lengths")
+
             # Allow time for async processing
             import time
             time.sleep(1)
@@ -88,6 +88,26 @@ void test_specific_patterns() {
   HLOG(kSuccess, "PASSED: Specific patterns test");
 }
 
+/**
+ * Test that the count-only query agrees with the full query
+ */
+void test_query_count() {
+  HLOG(kInfo, "TEST: Query count");
+
+  iowarp::ContextInterface ctx_interface;
+
+  std::vector<std::string> results = ctx_interface.ContextQuery(".*", ".*");
+  size_t count = ctx_interface.ContextQueryCount(".*", ".*");
+  assert(count == results.size());
+
+  size_t missing = ctx_interface.ContextQueryCount("no_such_tag_xyz", ".*");
+  assert(missing == 0);
+  (void)missing;
+
+  HLOG(kInfo, "Count query returned {} matches", count);
+  HLOG(kSuccess, "PASSED: Query count test");
+}
+
 int main(int argc, char** argv) {
   (void)argc;  // Suppress unused parameter warning
   (void)argv;  // Suppress unused parameter warning
@@ -119,6 +139,8 @@ int main(int argc, char** argv) {
 
     test_specific_patterns();
 
+    test_query_count();
+
     HLOG(kSuccess, "All tests PASSED!");
     return 0;
   } catch (const std::exception& e) {
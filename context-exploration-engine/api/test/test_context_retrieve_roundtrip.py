@@ -57,20 +57,45 @@ def test_retrieve_roundtrip():
             max_context_size=4 * 1024 * 1024,
             batch_size=32,
         )
-        total_size = sum(len(d) for d in packed_data)
+        total_size = sum(map(len, packed_data))
         assert total_size > 0, "context_retrieve returned no data"
 
         # 4. Verify content
-        retrieved_bytes = b"".join(
-            d.encode("latin-1") if isinstance(d, str) else d
-            for d in packed_data
-        )
+        retrieved_bytes = b"".join(packed_data)
         assert original_data in retrieved_bytes, (
             f"Retrieved data ({len(retrieved_bytes)} bytes) does not contain "
             f"original data ({len(original_data)} bytes)"
         )
 
-        # 5. Destroy (cleanup)
+        # 5. Retrieve into a caller-owned buffer (no intermediate bytes)
+        out = bytearray(4 * 1024 * 1024)
+        written, offsets = ctx_interface.context_retrieve_into(
+            tag_name, ".*", memoryview(out), max_results=1024, batch_size=32,
+        )
+        assert written == len(retrieved_bytes), (
+            f"context_retrieve_into wrote {written} bytes, "
+            f"expected {len(retrieved_bytes)}"
+        )
+        assert len(offsets) > 0 and offsets[0] == 0, (
+            f"Unexpected blob offsets: {offsets}"
+        )
+        assert out.find(original_data, 0, written) != -1, (
+            "context_retrieve_into data does not contain original data"
+        )
+
+        # 6. Retrieve one blob at a time
+        streamed = []
+        count = ctx_interface.context_retrieve_each(
+            tag_name, ".*", streamed.append, max_results=1024, batch_size=4,
+        )
+        assert count == len(offsets), (
+            f"context_retrieve_each returned {count} blobs, expected {len(offsets)}"
+        )
+        assert sum(map(len, streamed)) == written, (
+            "context_retrieve_each data size does not match packed retrieve"
+        )
+
+        # 7. Destroy (cleanup)
         destroy_result = ctx_interface.context_destroy([tag_name])
         assert destroy_result == 0, f"context_destroy failed with code {destroy_result}"
 
@@ -255,14 +255,14 @@ class ArrayText(compass_model.Text):
             txt += str(self.data)
 
         elif len(self.shape) == 1:
-            for el in self.data:
-                txt += el + ",\n"
+            # Build fragments and join once; += copies the whole string per element
+            txt = "".join([el + ",\n" for el in self.data])
 
         elif len(self.shape) == 2:
-            for i in range(self.shape[0]):
-                for j in range(self.shape[1]):
-                    txt += self.data[i, j] + ", "
-                txt += "\n"
+            txt = "".join([
+                "".join([self.data[i, j] + ", " for j in range(self.shape[1])]) + "\n"
+                for i in range(self.shape[0])
+            ])
 
         else:
             txt = ">> display of more than 2D string array not implemented <<"
@@ -243,14 +243,14 @@ class ContainerFrame(NodeFrame):
                         self.go(selected_node)
                     else:
                         # Create an open event for the selected node to open in new window
-                        log.debug(f"Creating new window for non-container node: {selected_node.key} (type: {type(selected_node)})")
+                        log.debug("Creating new window for non-container node: %s (type: %s)", selected_node.key, type(selected_node))
                         from ..events import CompassOpenEvent
                         open_event = CompassOpenEvent(selected_node, pos=self.GetPosition())
-                        log.debug(f"Posting CompassOpenEvent for node: {selected_node.key}")
+                        log.debug("Posting CompassOpenEvent for node: %s", selected_node.key)
                         wx.PostEvent(wx.GetApp(), open_event)
                 else:
                     log.debug("No node selected for open action")
                     evt.Skip()
         except Exception as e:
-            log.exception(f"Error in on_open: {e}")
+            log.exception("Error in on_open: %s", e)
             evt.Skip()
@@ -89,7 +89,7 @@ class ContainerList(wx.ListCtrl):
                 return
                 
             if index < 0 or index >= len(self.node):
-                log.warning(f"Item activation index {index} out of bounds")
+                log.warning("Item activation index %s out of bounds", index)
                 evt.Skip()
                 return
             child = self.node[index]
@@ -99,7 +99,7 @@ class ContainerList(wx.ListCtrl):
             open_event = CompassOpenEvent(child, pos=pos)
             wx.PostEvent(wx.GetApp(), open_event)
         except Exception as e:
-            log.exception(f"Error in item activation: {e}")
+            log.exception("Error in item activation: %s", e)
         evt.Skip()
 
     def on_item_selected(self, evt):
@@ -113,7 +113,7 @@ class ContainerList(wx.ListCtrl):
                 return
                 
             if index < 0 or index >= len(self.node):
-                log.warning(f"Item selection index {index} out of bounds")
+                log.warning("Item selection index %s out of bounds", index)
                 evt.Skip()
                 return
             child = self.node[index]
@@ -121,7 +121,7 @@ class ContainerList(wx.ListCtrl):
             selection_event = ContainerSelectionEvent(child)
             wx.PostEvent(self.parent, selection_event)
         except Exception as e:
-            log.exception(f"Error in item selection: {e}")
+            log.exception("Error in item selection: %s", e)
         evt.Skip()
 
     def on_right_click(self, evt):
@@ -159,7 +159,7 @@ class ContainerList(wx.ListCtrl):
                 return self.node[index]
             return None
         except Exception as e:
-            log.debug(f"Error getting selection (likely due to shutdown): {e}")
+            log.debug("Error getting selection (likely due to shutdown): %s", e)
             return None
 
 
@@ -291,7 +291,7 @@ class ContainerReportList(ContainerList):
                 
             # Check bounds first
             if item < 0 or item >= len(self.node):
-                log.warning(f"Item index {item} out of bounds (length: {len(self.node)})")
+                log.warning("Item index %s out of bounds (length: %s)", item, len(self.node))
                 return ""
                 
             subnode = self.node[item]
@@ -300,7 +300,7 @@ class ContainerReportList(ContainerList):
             elif col == 1:
                 return type(subnode).class_kind
         except Exception as e:
-            log.debug(f"Error getting item text for item {item}, col {col} (likely due to shutdown): {e}")
+            log.debug("Error getting item text for item %s, col %s (likely due to shutdown): %s", item, col, e)
         return ""
 
     def OnGetItemImage(self, item):
@@ -312,7 +312,7 @@ class ContainerReportList(ContainerList):
                 
             # Check bounds first
             if item < 0 or item >= len(self.node):
-                log.warning(f"Item index {item} out of bounds (length: {len(self.node)})")
+                log.warning("Item index %s out of bounds (length: %s)", item, len(self.node))
                 return -1
                 
             subnode = self.node[item]
@@ -320,7 +320,7 @@ class ContainerReportList(ContainerList):
                 return self.il.get_index(type(subnode))
             return -1
         except Exception as e:
-            log.debug(f"Error getting item image for item {item} (likely due to shutdown): {e}")
+            log.debug("Error getting item image for item %s (likely due to shutdown): %s", item, e)
             return -1
 
     def populate(self):
@@ -333,9 +333,9 @@ class ContainerReportList(ContainerList):
                 return
                 
             node_length = len(self.node)
-            log.debug(f"Setting virtual list item count to {node_length}")
+            log.debug("Setting virtual list item count to %s", node_length)
             self.SetItemCount(node_length)
             self.Refresh()
         except Exception as e:
-            log.exception(f"Error in populate: {e}")
+            log.exception("Error in populate: %s", e)
             self.SetItemCount(0)
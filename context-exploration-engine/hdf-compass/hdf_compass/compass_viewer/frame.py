@@ -396,9 +396,9 @@ class NodeFrame(BaseFrame):
                     self.Destroy()
         except RuntimeError as e:
             # Frame was already destroyed
-            log.debug(f"Frame already destroyed: {e}")
+            log.debug("Frame already destroyed: %s", e)
         except Exception as e:
-            log.exception(f"Error in on_notification_closefile: {e}")
+            log.exception("Error in on_notification_closefile: %s", e)
 
     def on_close_evt(self, evt):
         """ Window is about to be closed """
@@ -113,13 +113,13 @@ class CompassApp(wx.App):
     def on_compass_open(self, evt):
         """ A request has been made to open a node from somewhere in the GUI
         """
-        log.debug(f"CompassApp.on_compass_open called with event: {evt}")
+        log.debug("CompassApp.on_compass_open called with event: %s", evt)
         # Get the node from the event
         node = evt.node
-        log.debug(f"CompassApp.on_compass_open - node: {node.key}, type: {type(node)}")
+        log.debug("CompassApp.on_compass_open - node: %s, type: %s", node.key, type(node))
         # Get the position from the event if available
         pos = getattr(evt, 'pos', None)
-        log.debug(f"CompassApp.on_compass_open - calling open_node")
+        log.debug("CompassApp.on_compass_open - calling open_node")
         # Open the node
         open_node(node, pos)
 
@@ -172,13 +172,13 @@ def open_node(node, pos=None):
         f.Show()
 
     elif isinstance(node, compass_model.Array):
-        log.debug(f"Got Array - creating ArrayFrame for node: {node.key}")
+        log.debug("Got Array - creating ArrayFrame for node: %s", node.key)
         try:
             f = array.ArrayFrame(node, pos=new_pos)
-            log.debug(f"ArrayFrame created successfully, showing window")
+            log.debug("ArrayFrame created successfully, showing window")
             f.Show()
         except Exception as e:
-            log.exception(f"Error creating ArrayFrame: {e}")
+            log.exception("Error creating ArrayFrame: %s", e)
 
     elif isinstance(node, compass_model.Xml):
         f = text.XmlFrame(node, pos=new_pos)
@@ -181,7 +181,7 @@ class HDF5Group(compass_model.Container):
                 return 0
             return len(self._group)
         except Exception as e:
-            log.debug(f"Error getting group length (likely due to shutdown): {e}")
+            log.debug("Error getting group length (likely due to shutdown): %s", e)
             return 0
 
     def __iter__(self):
@@ -201,7 +201,7 @@ class HDF5Group(compass_model.Container):
             full_key = pp.join(self.key, name)
             return self.store[full_key]
         except Exception as e:
-            log.exception(f"Error accessing item {idx} in HDF5Group {self.key}: {e}")
+            log.exception("Error accessing item %s in HDF5Group %s: %s", idx, self.key, e)
             raise
 
 
@@ -322,14 +322,14 @@ class HDF5Text(compass_model.Text):
             txt += str(self.data[()])
 
         elif len(self.shape) == 1:
-            for el in self.data:
-                txt += str(el) + ", \n"
+            # Build fragments and join once; += copies the whole string per element
+            txt = "".join([str(el) + ", \n" for el in self.data])
 
         elif len(self.shape) == 2:
-            for i in range(self.shape[0]):
-                for j in range(self.shape[1]):
-                    txt += str(self.data[i, j]) + ", "
-                txt += "\n"
+            txt = "".join([
+                "".join([str(self.data[i, j]) + ", " for j in range(self.shape[1])]) + "\n"
+                for i in range(self.shape[0])
+            ])
 
         else:
             txt = ">> display of more than 2D string array not implemented <<"
@@ -27,17 +27,42 @@ Note: This wraps the wrp_cte_core_ext Python bindings.
 import sys
 import os
 import json
-import io
+import math
+import functools
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from contextlib import redirect_stderr, redirect_stdout
 
 # Redirect stderr at module level for MCP communication
 # This prevents C++ error messages from breaking JSON-RPC
 _original_stderr = sys.stderr
 _original_stdout = sys.stdout
 
-from mcp.server.fastmcp import FastMCP
+
+def _parse_init_delay(default=0.5):
+    """Seconds to wait after chimaera_init, from CHI_INIT_DELAY
+
+    A malformed or negative value falls back to the default with a warning
+    on stderr, so a typo cannot stop the server from starting.
+    """
+    raw = os.environ.get("CHI_INIT_DELAY", "").strip()
+    if not raw:
+        return default
+    try:
+        delay = float(raw)
+    except ValueError:
+        delay = None
+    if delay is None or not math.isfinite(delay) or delay < 0:
+        print(f"Warning: ignoring invalid CHI_INIT_DELAY={raw!r}, "
+              f"using {default}s", file=_original_stderr)
+        return default
+    return delay
+
+
+CHI_INIT_DELAY = _parse_init_delay()
+
+# Directory of this script, computed once at import. Kept lexical
+# (absolute, not resolved) so a symlinked server.py searches relative to
+# the link, as before.
+_SERVER_DIR = Path(__file__).absolute().parent
 
 # Try to find and add CTE Python bindings to path
 def _find_cte_bindings():
@@ -45,8 +70,8 @@ def _find_cte_bindings():
     # Common locations to search
     search_paths = [
         # Build directory (most likely location)
-        Path(__file__).parent.parent.parent / "build" / "bin",
-        Path(__file__).parent.parent.parent.parent / "build" / "bin",
+        _SERVER_DIR.parent.parent / "build" / "bin",
+        _SERVER_DIR.parent.parent.parent / "build" / "bin",
         # System install locations
         Path("/usr/local/lib"),
         Path("/usr/lib"),
@@ -100,13 +125,10 @@ except ImportError as e:
     CTE_AVAILABLE = False
     cte = None
 
-mcp = FastMCP("IOWarp Context Transfer Engine (CTE) MCP Server")
-
 # Global client and initialization state
 _initialized = False
 _runtime_initialized = False
 _client = None
-_mctx = None
 
 def _initialize_runtime() -> bool:
     """Attempt to initialize CTE runtime.
@@ -159,7 +181,7 @@ def _initialize_runtime() -> bool:
                 try:
                     chimaera_result = cte.chimaera_init(cte.ChimaeraMode.kClient, True)
                     if chimaera_result:
-                        time.sleep(0.5)  # Give Chimaera time to initialize (500ms as per tests)
+                        time.sleep(CHI_INIT_DELAY)  # Give Chimaera time to initialize
                 except Exception:
                     pass  # May fail in some environments
 
@@ -167,7 +189,7 @@ def _initialize_runtime() -> bool:
             cte_result = False
             if chimaera_result and hasattr(cte, 'initialize_cte') and hasattr(cte, 'PoolQuery'):
                 try:
-                    pool_query = cte.PoolQuery.Dynamic()
+                    pool_query = _get_pool_query_dynamic()
                     cte_result = cte.initialize_cte(config_path, pool_query)
                 except Exception:
                     pass  # May fail without proper config
@@ -199,7 +221,7 @@ def _ensure_initialized() -> bool:
     guarantee that CTE runtime is fully initialized. CTE runtime must be
     initialized separately before using query/reorganization functions.
     """
-    global _initialized, _client, _mctx
+    global _initialized, _client
     
     if not CTE_AVAILABLE:
         return False
@@ -210,7 +232,6 @@ def _ensure_initialized() -> bool:
     try:
         # Try to get the client - this will work if CTE is already initialized
         _client = cte.get_cte_client()
-        _mctx = cte.MemContext()
         _initialized = True
         return True
     except Exception as e:
@@ -221,9 +242,13 @@ def _ensure_initialized() -> bool:
         # are caught in the individual tool functions.
         return False
 
+@functools.cache
 def _get_pool_query_dynamic():
     """Get a PoolQuery::Dynamic() instance.
     
+    The result is cached: PoolQuery is an immutable routing descriptor, so
+    every tool call can share one instance instead of constructing a new one.
+    
     Note: PoolQuery may not be bound in Python yet. This attempts to access it.
     """
     try:
@@ -237,7 +262,16 @@ def _get_pool_query_dynamic():
     except Exception:
         return None
 
-@mcp.tool()
+@functools.cache
+def _get_pool_query_local():
+    """Get a shared PoolQuery::Local() instance (cached like the Dynamic one)."""
+    try:
+        if hasattr(cte, 'PoolQuery'):
+            return cte.PoolQuery.Local()
+        return None
+    except Exception:
+        return None
+
 def get_client_status() -> str:
     """Get the status of the CTE client connection and initialization."""
     if not CTE_AVAILABLE:
@@ -264,7 +298,6 @@ def get_client_status() -> str:
     
     return json.dumps(result, indent=2)
 
-@mcp.tool()
 def tag_query(tag_regex: str, max_tags: int = 0) -> str:
     """Query tags by regex pattern. Returns a list of tag names matching the pattern.
     
@@ -303,7 +336,7 @@ def tag_query(tag_regex: str, max_tags: int = 0) -> str:
     
     try:
         # Attempt the query - this may fail if CTE runtime is not initialized
-        tags = _client.TagQuery(_mctx, tag_regex, max_tags, pool_query)
+        tags = _client.TagQuery(tag_regex, max_tags, pool_query)
         return json.dumps({
             'tag_regex': tag_regex,
             'max_tags': max_tags,
@@ -332,7 +365,6 @@ def tag_query(tag_regex: str, max_tags: int = 0) -> str:
             'note': 'Query failed - CTE runtime may not be initialized'
         }, indent=2)
 
-@mcp.tool()
 def blob_query(tag_regex: str, blob_regex: str, max_blobs: int = 0) -> str:
     """Query blobs by tag and blob regex patterns.
     
@@ -375,7 +407,7 @@ def blob_query(tag_regex: str, blob_regex: str, max_blobs: int = 0) -> str:
     
     try:
         # Attempt the query - this may fail if CTE runtime is not initialized
-        blobs = _client.BlobQuery(_mctx, tag_regex, blob_regex, max_blobs, pool_query)
+        blobs = _client.BlobQuery(tag_regex, blob_regex, max_blobs, pool_query)
         # Convert pairs to lists for JSON serialization
         blob_list = [(tag, blob) for tag, blob in blobs]
         return json.dumps({
@@ -409,7 +441,6 @@ def blob_query(tag_regex: str, blob_regex: str, max_blobs: int = 0) -> str:
             'note': 'Query failed - CTE runtime may not be initialized'
         }, indent=2)
 
-@mcp.tool()
 def poll_telemetry_log(minimum_logical_time: int = 0) -> str:
     """Poll telemetry log with a minimum logical time filter.
     
@@ -437,7 +468,7 @@ def poll_telemetry_log(minimum_logical_time: int = 0) -> str:
     
     try:
         # Attempt the query - this may fail if CTE runtime is not initialized
-        telemetry = _client.PollTelemetryLog(_mctx, minimum_logical_time)
+        telemetry = _client.PollTelemetryLog(minimum_logical_time)
         
         # Serialize telemetry entries
         entries = []
@@ -486,7 +517,6 @@ def poll_telemetry_log(minimum_logical_time: int = 0) -> str:
             'note': 'Query failed - CTE runtime may not be initialized'
         }, indent=2)
 
-@mcp.tool()
 def reorganize_blob(tag_id_major: int, tag_id_minor: int, blob_name: str, new_score: float) -> str:
     """Reorganize blob placement with a new score for data placement optimization.
     
@@ -527,7 +557,7 @@ def reorganize_blob(tag_id_major: int, tag_id_minor: int, blob_name: str, new_sc
         tag_id.minor_ = tag_id_minor
         
         # Attempt reorganization - this may fail if CTE runtime is not initialized
-        result_code = _client.ReorganizeBlob(_mctx, tag_id, blob_name, new_score)
+        result_code = _client.ReorganizeBlob(tag_id, blob_name, new_score)
         
         return json.dumps({
             'tag_id': {
@@ -570,7 +600,6 @@ def reorganize_blob(tag_id_major: int, tag_id_minor: int, blob_name: str, new_sc
             'note': 'Reorganization failed - CTE runtime may not be initialized'
         }, indent=2)
 
-@mcp.tool()
 def initialize_cte_runtime() -> str:
     """Initialize the CTE runtime (Chimaera runtime, client, and CTE subsystem).
     
@@ -608,7 +637,7 @@ def initialize_cte_runtime() -> str:
     }
     
     # Create a temporary file to log initialization progress
-    log_file_path = os.path.join(tempfile.gettempdir(), f"cte_init_log_{os.getpid()}.json")
+    log_file_path = f"{tempfile.gettempdir()}/cte_init_log_{os.getpid()}.json"
     
     def log_progress(data):
         with open(log_file_path, 'w') as f:
@@ -648,36 +677,35 @@ def initialize_cte_runtime() -> str:
             # Step 0.5: Get or generate config path
             # If CHI_SERVER_CONF is set, use it; otherwise try to generate a minimal config
             config_path = os.getenv("CHI_SERVER_CONF", "")
+            generated_config = None
             
             if not config_path:
                 # Try to generate a minimal config file (following test_bindings.py pattern)
                 try:
                     import socket
-                    import yaml
                     
-                    def find_available_port(start_port=9129, end_port=9200):
-                        """Find an available port in the given range"""
-                        for port in range(start_port, end_port):
-                            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                                try:
-                                    s.bind(('', port))
-                                    return port
-                                except OSError:
-                                    continue
-                        return None
+                    def find_available_port():
+                        """Let the kernel pick a free ephemeral port"""
+                        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                            s.bind(('', 0))
+                            return s.getsockname()[1]
                     
                     # Find available port
                     port = find_available_port()
                     if port:
+                        # Fixed relative names under the temp dir, so plain
+                        # f-strings suffice (the server is POSIX-only)
                         temp_dir = tempfile.gettempdir()
+                        pid = os.getpid()
                         
                         # Create hostfile
-                        hostfile = os.path.join(temp_dir, f"cte_mcp_hostfile_{os.getpid()}")
-                        with open(hostfile, 'w') as f:
-                            f.write("127.0.0.1\n")
+                        hostfile = f"{temp_dir}/cte_mcp_hostfile_{pid}"
+                        with open(hostfile, 'wb') as f:
+                            f.write(b"127.0.0.1\n")
                         
                         # Create storage directory
-                        storage_dir = os.path.join(temp_dir, f"cte_mcp_storage_{os.getpid()}")
+                        storage_dir = f"{temp_dir}/cte_mcp_storage_{pid}"
                         os.makedirs(storage_dir, exist_ok=True)
                         
                         # Generate config
@@ -703,17 +731,16 @@ def initialize_cte_runtime() -> str:
                             ]
                         }
                         
-                        # Write config
-                        config_path = os.path.join(temp_dir, f"cte_mcp_conf_{os.getpid()}.yaml")
-                        with open(config_path, 'w') as f:
-                            yaml.dump(config, f)
+                        # Write config as JSON (valid YAML for the runtime's parser)
+                        config_path = f"{temp_dir}/cte_mcp_conf_{pid}.yaml"
+                        with open(config_path, 'wb') as f:
+                            f.write(json.dumps(config).encode())
+                        generated_config = config
                         
                         os.environ['CHI_SERVER_CONF'] = config_path
                         result['messages'].append(f'Generated config file: {config_path} (port: {port})')
                     else:
                         result['messages'].append('Could not find available port for config generation')
-                except ImportError:
-                    result['messages'].append('PyYAML not available - cannot generate config (install pyyaml or set CHI_SERVER_CONF)')
                 except Exception as e:
                     result['messages'].append(f'Config generation failed: {type(e).__name__}: {str(e)}')
             else:
@@ -732,7 +759,7 @@ def initialize_cte_runtime() -> str:
                     result['client_init'] = bool(chimaera_result)
                     if chimaera_result:
                         # Give Chimaera time to initialize all components (500ms as per tests)
-                        time.sleep(0.5)
+                        time.sleep(CHI_INIT_DELAY)
                         result['messages'].append('Chimaera initialized successfully')
                     else:
                         # Init returned False - might already be initialized or failed silently
@@ -765,7 +792,7 @@ def initialize_cte_runtime() -> str:
             # Step 2: Initialize CTE subsystem (following test_bindings.py pattern)
             if hasattr(cte, 'initialize_cte') and hasattr(cte, 'PoolQuery') and result['client_init']:
                 try:
-                    pool_query = cte.PoolQuery.Dynamic()
+                    pool_query = _get_pool_query_dynamic()
                     cte_result = cte.initialize_cte(config_path, pool_query)
                     result['cte_init'] = cte_result
                     if cte_result:
@@ -777,15 +804,17 @@ def initialize_cte_runtime() -> str:
                         # Following test_bindings.py pattern
                         try:
                             client = cte.get_cte_client()
-                            mctx = cte.MemContext()
                             
-                            # Get storage directory from config if available
+                            # Get storage directory from config if available;
+                            # a generated config is reused as-is instead of re-parsed
                             storage_dir = None
                             if config_path:
                                 try:
-                                    import yaml
-                                    with open(config_path, 'r') as f:
-                                        config = yaml.safe_load(f)
+                                    config = generated_config
+                                    if config is None:
+                                        import yaml
+                                        with open(config_path, 'r') as f:
+                                            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
                                     devices = config.get('devices', [])
                                     if devices and len(devices) > 0:
                                         storage_dir = devices[0].get('mount_point')
@@ -794,7 +823,7 @@ def initialize_cte_runtime() -> str:
                             
                             # Use default if not in config
                             if not storage_dir:
-                                storage_dir = os.path.join(tempfile.gettempdir(), f"cte_mcp_storage_{os.getpid()}")
+                                storage_dir = f"{tempfile.gettempdir()}/cte_mcp_storage_{os.getpid()}"
                                 os.makedirs(storage_dir, exist_ok=True)
                             
                             # Create target path
@@ -804,10 +833,10 @@ def initialize_cte_runtime() -> str:
                             # Register file-based target (512MB size) with high pool ID to avoid conflicts
                             if hasattr(cte, 'BdevType') and hasattr(cte, 'PoolId') and hasattr(client, 'RegisterTarget'):
                                 bdev_id = cte.PoolId(700, 0)
-                                target_query = cte.PoolQuery.Local()
+                                target_query = _get_pool_query_local()
                                 target_size = 512 * 1024 * 1024  # 512MB
                                 
-                                reg_result = client.RegisterTarget(mctx, target_path, cte.BdevType.kFile,
+                                reg_result = client.RegisterTarget(target_path, cte.BdevType.kFile,
                                                                   target_size, target_query, bdev_id)
                                 
                                 if reg_result == 0:
@@ -864,7 +893,7 @@ def initialize_cte_runtime() -> str:
         
         # Add helpful message if initialization failed
         if not result['success']:
-            result['note'] = 'CTE runtime initialization may require external setup. Options: 1) Set CHI_SERVER_CONF to a valid config file path, 2) Ensure PyYAML is installed for automatic config generation (pip install pyyaml), 3) Ensure Chimaera runtime is not already running on the same port, 4) Use external Chimaera runtime setup. Note: If initialization fails with process exit, the C++ code may have called FATAL - check logs or try external setup.'
+            result['note'] = 'CTE runtime initialization may require external setup. Options: 1) Set CHI_SERVER_CONF to a valid config file path, 2) Ensure a writable temp directory is available for automatic config generation, 3) Ensure Chimaera runtime is not already running on the same port, 4) Use external Chimaera runtime setup. Note: If initialization fails with process exit, the C++ code may have called FATAL - check logs or try external setup.'
         log_progress(result) # Log before finally block
         
     except Exception as e:
@@ -885,7 +914,6 @@ def initialize_cte_runtime() -> str:
             'messages': ['Initialization attempted but failed']
         }, indent=2)
 
-@mcp.tool()
 def put_blob(tag_name: str, blob_name: str, data: str, offset: int = 0) -> str:
     """Create or get a tag and store blob data (context_bundle operation).
     
@@ -957,7 +985,6 @@ def put_blob(tag_name: str, blob_name: str, data: str, offset: int = 0) -> str:
             'note': 'PutBlob may fail if runtime is not initialized or storage target is not registered'
         }, indent=2)
 
-@mcp.tool()
 def list_blobs_in_tag(tag_name: str) -> str:
     """List all blob names contained in a tag (context_query - list operation).
     
@@ -1015,7 +1042,6 @@ def list_blobs_in_tag(tag_name: str) -> str:
             'message': str(e)
         }, indent=2)
 
-@mcp.tool()
 def get_blob_size(tag_name: str, blob_name: str) -> str:
     """Get the size of a blob in a tag (context_query - get size operation).
     
@@ -1072,7 +1098,6 @@ def get_blob_size(tag_name: str, blob_name: str) -> str:
             'message': str(e)
         }, indent=2)
 
-@mcp.tool()
 def get_blob(tag_name: str, blob_name: str, size: int = 0, offset: int = 0) -> str:
     """Retrieve blob data from a tag (context_query - get data operation).
     
@@ -1164,7 +1189,6 @@ def get_blob(tag_name: str, blob_name: str, size: int = 0, offset: int = 0) -> s
             'message': str(e)
         }, indent=2)
 
-@mcp.tool()
 def delete_blob(tag_name: str, blob_name: str) -> str:
     """Delete a blob from a tag (context_delete operation).
     
@@ -1213,7 +1237,7 @@ def delete_blob(tag_name: str, blob_name: str) -> str:
                 'error': 'DelBlob method not available on Client'
             }, indent=2)
         
-        result = _client.DelBlob(_mctx, tag_id, blob_name)
+        result = _client.DelBlob(tag_id, blob_name)
         
         return json.dumps({
             'tag_name': tag_name,
@@ -1230,7 +1254,6 @@ def delete_blob(tag_name: str, blob_name: str) -> str:
             'message': str(e)
         }, indent=2)
 
-@mcp.tool()
 def get_cte_types() -> str:
     """Get information about available CTE types and operations.
     
@@ -1293,5 +1316,43 @@ def get_cte_types() -> str:
             'error': str(e)
         }, indent=2)
 
+# Tools exposed over MCP, in registration order. Registration is deferred to
+# _lazy_mcp() so importing this module to call the tools directly does not
+# pay for the FastMCP import and server construction.
+_TOOLS = (
+    get_client_status,
+    tag_query,
+    blob_query,
+    poll_telemetry_log,
+    reorganize_blob,
+    initialize_cte_runtime,
+    put_blob,
+    list_blobs_in_tag,
+    get_blob_size,
+    get_blob,
+    delete_blob,
+    get_cte_types,
+)
+
+_mcp = None
+
+
+def _lazy_mcp():
+    """Construct the FastMCP server and register all tools on first use."""
+    global _mcp
+    if _mcp is None:
+        from mcp.server.fastmcp import FastMCP
+
+        _mcp = FastMCP("IOWarp Context Transfer Engine (CTE) MCP Server")
+        for tool in _TOOLS:
+            _mcp.tool()(tool)
+    return _mcp
+
+
+def main():
+    """Run the MCP server over stdio."""
+    _lazy_mcp().run()
+
+
 if __name__ == "__main__":
-    mcp.run()
+    main()
@@ -14,6 +14,10 @@ from pathlib import Path
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# Section banners, built once and printed with a single call
+SEP = "=" * 80
+BANNER = f"{SEP}\n{{}}\n{SEP}"
+
 # Colors for output
 class Colors:
     PASS = '\033[92m'  # Green
@@ -78,11 +82,72 @@ async def test_tool(session, tool_name, arguments, expected_fields=None):
         print_test(f"{tool_name}", "FAIL", f"Exception: {str(e)}")
         return False
 
+# Regex that matches every tag/blob name; the CTE runtime recognizes this
+# exact pattern and skips regex matching for it
+MATCH_ALL = ".*"
+
+# Tool calls grouped by section: (tool_name, arguments, expected_fields)
+TOOL_TESTS = [
+    ("1. Runtime Management Tools", [
+        ("get_client_status", {}, ["available"]),
+        ("get_cte_types", {}, ["available"]),
+    ]),
+    ("2. Runtime Initialization", [
+        ("initialize_cte_runtime", {},
+         ["success", "runtime_init", "client_init", "cte_init"]),
+    ]),
+    ("3. Context Interface Operations", [
+        # Put Blob (context_bundle)
+        ("put_blob", {
+            "tag_name": "test_tag",
+            "blob_name": "test_blob",
+            "data": "Hello, World!"
+        }, ["tag_name", "blob_name", "success"]),
+        # List Blobs (context_query - list)
+        ("list_blobs_in_tag", {
+            "tag_name": "test_tag"
+        }, ["tag_name", "blobs", "count"]),
+        # Get Blob Size (context_query - get size)
+        ("get_blob_size", {
+            "tag_name": "test_tag",
+            "blob_name": "test_blob"
+        }, ["tag_name", "blob_name", "size"]),
+        # Get Blob (context_query - get data)
+        ("get_blob", {
+            "tag_name": "test_tag",
+            "blob_name": "test_blob"
+        }, ["tag_name", "blob_name"]),
+        # Delete Blob (context_delete)
+        ("delete_blob", {
+            "tag_name": "test_tag",
+            "blob_name": "test_blob"
+        }, ["tag_name", "blob_name", "success"]),
+    ]),
+    ("4. Additional CTE Operations", [
+        ("tag_query", {
+            "tag_regex": MATCH_ALL,
+            "max_tags": 10
+        }, ["tag_regex", "tags", "count"]),
+        ("blob_query", {
+            "tag_regex": MATCH_ALL,
+            "blob_regex": MATCH_ALL,
+            "max_blobs": 10
+        }, ["tag_regex", "blob_regex", "blobs", "count"]),
+        ("poll_telemetry_log", {
+            "minimum_logical_time": 0
+        }, ["minimum_logical_time", "entries", "count"]),
+        ("reorganize_blob", {
+            "tag_id_major": 0,
+            "tag_id_minor": 0,
+            "blob_name": "test_blob",
+            "new_score": 0.5
+        }, ["tag_id", "blob_name", "new_score", "success"]),
+    ]),
+]
+
 async def main():
     """Run all MCP tool tests."""
-    print("=" * 80)
-    print("IOWarp CTE MCP Server - Test Suite")
-    print("=" * 80)
+    print(BANNER.format("IOWarp CTE MCP Server - Test Suite"))
     
     # Setup server parameters
     server_script = Path(__file__).parent / "server.py"
@@ -108,153 +173,21 @@ async def main():
             tools_response = await session.list_tools()
             print(f"\n📋 Found {len(tools_response.tools)} available tools")
             
-            # Test 1: Runtime Management Tools (always work)
-            print("\n" + "=" * 80)
-            print("1. Runtime Management Tools")
-            print("=" * 80)
-            
-            result = await test_tool(session, "get_client_status", {}, 
-                                   expected_fields=["available"])
-            results["PASS" if result else "FAIL"].append("get_client_status")
-            
-            result = await test_tool(session, "get_cte_types", {},
-                                   expected_fields=["available"])
-            results["PASS" if result else "FAIL"].append("get_cte_types")
-            
-            # Test 2: Initialize Runtime (may succeed or fail depending on environment)
-            print("\n" + "=" * 80)
-            print("2. Runtime Initialization")
-            print("=" * 80)
-            
-            result = await test_tool(session, "initialize_cte_runtime", {},
-                                   expected_fields=["success", "runtime_init", "client_init", "cte_init"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("initialize_cte_runtime")
-            elif result:
-                results["PASS"].append("initialize_cte_runtime")
-            else:
-                results["FAIL"].append("initialize_cte_runtime")
-            
-            # Test 3: Context Interface Operations
-            print("\n" + "=" * 80)
-            print("3. Context Interface Operations")
-            print("=" * 80)
-            
-            # 3.1: Put Blob (context_bundle)
-            result = await test_tool(session, "put_blob", {
-                "tag_name": "test_tag",
-                "blob_name": "test_blob",
-                "data": "Hello, World!"
-            }, expected_fields=["tag_name", "blob_name", "success"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("put_blob")
-            elif result:
-                results["PASS"].append("put_blob")
-            else:
-                results["FAIL"].append("put_blob")
-            
-            # 3.2: List Blobs (context_query - list)
-            result = await test_tool(session, "list_blobs_in_tag", {
-                "tag_name": "test_tag"
-            }, expected_fields=["tag_name", "blobs", "count"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("list_blobs_in_tag")
-            elif result:
-                results["PASS"].append("list_blobs_in_tag")
-            else:
-                results["FAIL"].append("list_blobs_in_tag")
-            
-            # 3.3: Get Blob Size (context_query - get size)
-            result = await test_tool(session, "get_blob_size", {
-                "tag_name": "test_tag",
-                "blob_name": "test_blob"
-            }, expected_fields=["tag_name", "blob_name", "size"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("get_blob_size")
-            elif result:
-                results["PASS"].append("get_blob_size")
-            else:
-                results["FAIL"].append("get_blob_size")
-            
-            # 3.4: Get Blob (context_query - get data)
-            result = await test_tool(session, "get_blob", {
-                "tag_name": "test_tag",
-                "blob_name": "test_blob"
-            }, expected_fields=["tag_name", "blob_name"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("get_blob")
-            elif result:
-                results["PASS"].append("get_blob")
-            else:
-                results["FAIL"].append("get_blob")
-            
-            # 3.5: Delete Blob (context_delete)
-            result = await test_tool(session, "delete_blob", {
-                "tag_name": "test_tag",
-                "blob_name": "test_blob"
-            }, expected_fields=["tag_name", "blob_name", "success"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("delete_blob")
-            elif result:
-                results["PASS"].append("delete_blob")
-            else:
-                results["FAIL"].append("delete_blob")
-            
-            # Test 4: Additional CTE Operations
-            print("\n" + "=" * 80)
-            print("4. Additional CTE Operations")
-            print("=" * 80)
-            
-            result = await test_tool(session, "tag_query", {
-                "tag_regex": ".*",
-                "max_tags": 10
-            }, expected_fields=["tag_regex", "tags", "count"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("tag_query")
-            elif result:
-                results["PASS"].append("tag_query")
-            else:
-                results["FAIL"].append("tag_query")
-            
-            result = await test_tool(session, "blob_query", {
-                "tag_regex": ".*",
-                "blob_regex": ".*",
-                "max_blobs": 10
-            }, expected_fields=["tag_regex", "blob_regex", "blobs", "count"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("blob_query")
-            elif result:
-                results["PASS"].append("blob_query")
-            else:
-                results["FAIL"].append("blob_query")
-            
-            result = await test_tool(session, "poll_telemetry_log", {
-                "minimum_logical_time": 0
-            }, expected_fields=["minimum_logical_time", "entries", "count"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("poll_telemetry_log")
-            elif result:
-                results["PASS"].append("poll_telemetry_log")
-            else:
-                results["FAIL"].append("poll_telemetry_log")
-            
-            result = await test_tool(session, "reorganize_blob", {
-                "tag_id_major": 0,
-                "tag_id_minor": 0,
-                "blob_name": "test_blob",
-                "new_score": 0.5
-            }, expected_fields=["tag_id", "blob_name", "new_score", "success"])
-            if result == "EXPECTED_FAILURE":
-                results["EXPECTED_FAILURE"].append("reorganize_blob")
-            elif result:
-                results["PASS"].append("reorganize_blob")
-            else:
-                results["FAIL"].append("reorganize_blob")
+            for section, tests in TOOL_TESTS:
+                print("\n" + BANNER.format(section))
+
+                for tool_name, arguments, expected_fields in tests:
+                    result = await test_tool(session, tool_name, arguments,
+                                             expected_fields=expected_fields)
+                    if result == "EXPECTED_FAILURE":
+                        results["EXPECTED_FAILURE"].append(tool_name)
+                    elif result:
+                        results["PASS"].append(tool_name)
+                    else:
+                        results["FAIL"].append(tool_name)
     
     # Print summary
-    print("\n" + "=" * 80)
-    print("Test Summary")
-    print("=" * 80)
+    print("\n" + BANNER.format("Test Summary"))
     
     total_tests = len(results["PASS"]) + len(results["FAIL"]) + len(results["EXPECTED_FAILURE"])
     
@@ -501,6 +501,15 @@ private:
    */
   chi::PoolQuery HashBlobToContainer(const TagId &tag_id,
                                      const std::string &blob_name);
+
+  /**
+   * Find the tags whose names match a query pattern
+   * @param tag_regex Tag regex pattern; literal names use a direct lookup
+   * @return (tag_name, tag_id) pairs for every matching tag
+   * @throws std::regex_error if the pattern is invalid
+   */
+  std::vector<std::pair<std::string, TagId>> FindMatchingTags(
+      const std::string &tag_regex);
 };
 
 } // namespace wrp_cte::core
@@ -66,6 +66,118 @@ using chi::Worker;
 
 // No more static member definitions - using instance-based locking
 
+namespace {
+
+/** Maximum number of compiled query patterns cached per worker thread */
+constexpr size_t kRegexCacheSize = 256;
+
+/**
+ * Syntax flags for query patterns. Queries only need a match/no-match
+ * answer, so capture groups are not tracked (nosubs), and since compiled
+ * patterns are cached, matching speed is favored over construction time
+ * (optimize).
+ */
+constexpr std::regex::flag_type kQueryRegexFlags =
+    std::regex::ECMAScript | std::regex::optimize | std::regex::nosubs;
+
+/**
+ * A tag/blob query pattern with fast paths for common shapes.
+ *
+ * Most queries are the catch-all ".*", a plain tag/blob name, or a name
+ * prefix such as "chunk_.*". Those are answered without compiling or
+ * running the regex engine; everything else
+ * falls back to a full std::regex_match.
+ */
+class QueryPattern {
+ public:
+  /** How a pattern is evaluated against a name */
+  enum class Mode {
+    kMatchAll,  /**< ".*": matches any name without a line terminator */
+    kLiteral,   /**< No metacharacters: exact string comparison */
+    kPrefix,    /**< "literal.*": prefix comparison plus ".*" on the rest */
+    kRegex      /**< General regex: std::regex_match */
+  };
+
+  /**
+   * Classify and compile a pattern
+   * @param pattern Regex pattern string
+   * @throws std::regex_error if the pattern is an invalid regex
+   */
+  explicit QueryPattern(const std::string &pattern) : pattern_(pattern) {
+    static constexpr const char *kMetaChars = "\\^$.|?*+()[]{}";
+    if (pattern == ".*") {
+      mode_ = Mode::kMatchAll;
+    } else if (pattern.find_first_of(kMetaChars) == std::string::npos) {
+      mode_ = Mode::kLiteral;
+    } else if (pattern.size() > 2 &&
+               pattern.compare(pattern.size() - 2, 2, ".*") == 0 &&
+               pattern.find_first_of(kMetaChars) == pattern.size() - 2) {
+      mode_ = Mode::kPrefix;
+      pattern_.resize(pattern.size() - 2);
+    } else {
+      mode_ = Mode::kRegex;
+      regex_ = std::regex(pattern, kQueryRegexFlags);
+    }
+  }
+
+  /** @return true if the pattern is a plain name with no metacharacters */
+  bool IsLiteral() const { return mode_ == Mode::kLiteral; }
+
+  /**
+   * Check whether a name fully matches the pattern
+   * @param name Tag or blob name to test
+   * @return true if the whole name matches
+   */
+  bool Match(const std::string &name) const {
+    switch (mode_) {
+      case Mode::kMatchAll:
+        // ECMAScript '.' does not match line terminators
+        return name.find_first_of("\n\r") == std::string::npos;
+      case Mode::kLiteral:
+        return name == pattern_;
+      case Mode::kPrefix:
+        return name.compare(0, pattern_.size(), pattern_) == 0 &&
+               name.find_first_of("\n\r", pattern_.size()) ==
+                   std::string::npos;
+      default:
+        return std::regex_match(name, regex_);
+    }
+  }
+
+ private:
+  std::string pattern_;  /**< Pattern string (prefix only in kPrefix mode) */
+  Mode mode_;            /**< Evaluation strategy chosen at construction */
+  std::regex regex_;     /**< Compiled regex (kRegex mode only) */
+};
+
+/**
+ * Get the compiled form of a query pattern, compiling it at most once per
+ * worker thread. TagQuery/BlobQuery are issued repeatedly with the same
+ * patterns, and std::regex construction costs far more than matching.
+ * The cache is cleared once it reaches kRegexCacheSize entries.
+ * @param pattern Regex pattern string
+ * @return Shared handle to the compiled pattern
+ * @throws std::regex_error if the pattern is invalid
+ */
+std::shared_ptr<const QueryPattern> GetCachedPattern(
+    const std::string &pattern) {
+  thread_local std::unordered_map<std::string,
+                                  std::shared_ptr<const QueryPattern>>
+      cache;
+  auto it = cache.find(pattern);
+  if (it != cache.end()) {
+    return it->second;
+  }
+  auto compiled = std::make_shared<const QueryPattern>(pattern);
+  if (cache.size() >= kRegexCacheSize) {
+    cache.clear();
+  }
+  cache.emplace(pattern, compiled);
+  return compiled;
+}
+
+}  // namespace
+
 chi::u64 Runtime::ParseCapacityToBytes(const std::string &capacity_str) {
   if (capacity_str.empty()) {
     return 0;
@@ -3144,18 +3256,9 @@ chi::TaskResume Runtime::TagQuery(hipc::FullPtr<TagQueryTask> task,
   try {
     std::string tag_regex = task->tag_regex_.str();
 
-    // Create regex pattern
-    std::regex pattern(tag_regex);
-
     // Collect matching tags (name + id)
-    std::vector<std::pair<std::string, TagId>> matching_tags;
-    tag_name_to_id_.for_each(
-        [&pattern, &matching_tags](const std::string &tag_name,
-                                   const TagId &tag_id) {
-          if (std::regex_match(tag_name, pattern)) {
-            matching_tags.emplace_back(tag_name, tag_id);
-          }
-        });
+    std::vector<std::pair<std::string, TagId>> matching_tags =
+        FindMatchingTags(tag_regex);
 
     // Total matched tags (summed across replicas during Aggregate)
     task->total_tags_matched_ = matching_tags.size();
@@ -3196,19 +3299,13 @@ chi::TaskResume Runtime::BlobQuery(hipc::FullPtr<BlobQueryTask> task,
     std::string tag_regex = task->tag_regex_.str();
     std::string blob_regex = task->blob_regex_.str();
 
-    // Create regex patterns
-    std::regex tag_pattern(tag_regex);
-    std::regex blob_pattern(blob_regex);
+    // Get compiled blob pattern (cached across queries)
+    std::shared_ptr<const QueryPattern> blob_pattern =
+        GetCachedPattern(blob_regex);
 
     // Find matching tag IDs and names
-    std::vector<std::pair<std::string, TagId>> matching_tags;
-    tag_name_to_id_.for_each(
-        [&tag_pattern, &matching_tags](const std::string &tag_name,
-                                       const TagId &tag_id) {
-          if (std::regex_match(tag_name, tag_pattern)) {
-            matching_tags.emplace_back(tag_name, tag_id);
-          }
-        });
+    std::vector<std::pair<std::string, TagId>> matching_tags =
+        FindMatchingTags(tag_regex);
 
     // Build results: pairs of (tag_name, blob_name) for matching blobs.
     // Also compute total_blobs_matched_.
@@ -3231,7 +3328,7 @@ chi::TaskResume Runtime::BlobQuery(hipc::FullPtr<BlobQueryTask> task,
             (void)blob_info;
             if (composite_key.rfind(prefix, 0) == 0) {
               std::string blob_name = composite_key.substr(prefix.length());
-              if (std::regex_match(blob_name, blob_pattern)) {
+              if (blob_pattern->Match(blob_name)) {
                 // Increase total matched counter (counts all matches)
                 task->total_blobs_matched_++;
                 // Respect max_blobs_ if set
@@ -3261,6 +3358,32 @@ chi::TaskResume Runtime::BlobQuery(hipc::FullPtr<BlobQueryTask> task,
   CHI_TASK_BODY_END
 }
 
+std::vector<std::pair<std::string, TagId>> Runtime::FindMatchingTags(
+    const std::string &tag_regex) {
+  // Get compiled query pattern (cached across queries)
+  std::shared_ptr<const QueryPattern> pattern = GetCachedPattern(tag_regex);
+
+  std::vector<std::pair<std::string, TagId>> matching_tags;
+  if (pattern->IsLiteral()) {
+    // Exact tag name: a single hash lookup instead of scanning every tag
+    chi::ScopedCoRwReadLock lock(tag_map_lock_);
+    TagId *tag_id_ptr = tag_name_to_id_.find(tag_regex);
+    if (tag_id_ptr != nullptr) {
+      matching_tags.emplace_back(tag_regex, *tag_id_ptr);
+    }
+    return matching_tags;
+  }
+
+  tag_name_to_id_.for_each(
+      [&pattern, &matching_tags](const std::string &tag_name,
+                                 const TagId &tag_id) {
+        if (pattern->Match(tag_name)) {
+          matching_tags.emplace_back(tag_name, tag_id);
+        }
+      });
+  return matching_tags;
+}
+
 // ==============================================================================
 // Helper Functions for Dynamic Scheduling
 // ==============================================================================
@@ -20,9 +20,13 @@ Usage:
     # Run with runtime initialization (default)
     python3 test_bindings.py
 
-    # Run without runtime initialization
+    # Binding-only run: skip runtime initialization and runtime tests
     CHI_WITH_RUNTIME=0 python3 test_bindings.py
 
+    # Run against an already-running runtime (client-only; fast dev loop)
+    chimaera runtime start &            # once, in another shell
+    CHI_WITH_RUNTIME=0 CHI_EXTERNAL_RUNTIME=1 python3 test_bindings.py
+
 Example Usage in Your Code:
 ---------------------------
     import wrp_cte_core_ext as cte
@@ -48,6 +52,10 @@ Example Usage in Your Code:
 Environment Variables:
 ---------------------
     CHI_WITH_RUNTIME: Set to "0" or "false" to skip runtime initialization
+    CHI_EXTERNAL_RUNTIME: With CHI_WITH_RUNTIME=0, set to "1" to connect as a
+                      client to an externally started runtime; the runtime
+                      tests are skipped if nothing listens on CHI_PORT
+    CHI_PORT: Runtime port probed before connecting (default: 9413)
     CHI_SERVER_CONF: Path to Chimaera server configuration file
     CHI_REPO_PATH: Path to ChiMod repository (for finding shared libraries)
     LD_LIBRARY_PATH: Library path for runtime dependencies
@@ -55,12 +63,44 @@ Environment Variables:
 
 import sys
 import os
+import json
+import math
 import time
 import signal
+import socket
+import traceback
 
 # Add current directory to path for module import
 sys.path.insert(0, os.getcwd())
 
+
+def parse_init_delay(default=0.5):
+    """Read CHI_INIT_DELAY, the seconds to wait after chimaera_init
+
+    The C++ tests wait 500ms; set CHI_INIT_DELAY to shorten it on fast
+    machines. A malformed or negative value falls back to the default with
+    a warning rather than failing at import.
+    """
+    raw = os.environ.get("CHI_INIT_DELAY", "").strip()
+    if not raw:
+        return default
+    try:
+        delay = float(raw)
+    except ValueError:
+        delay = None
+    if delay is None or not math.isfinite(delay) or delay < 0:
+        print(f"Warning: ignoring invalid CHI_INIT_DELAY={raw!r}, "
+              f"using {default}s", file=sys.stderr)
+        return default
+    return delay
+
+
+CHI_INIT_DELAY = parse_init_delay()
+
+# Section banners, built once and printed with a single call
+SEP = "=" * 70
+BANNER = f"{SEP}\n{{}}\n{SEP}"
+
 # Global state tracking for runtime initialization
 runtime_initialized = False
 client_initialized = False
@@ -68,6 +108,9 @@ client_initialized = False
 # Track if we're attempting initialization
 _initialization_attempted = False
 
+# Config dict written by generate_test_config (reused instead of re-parsing)
+_test_config = None
+
 
 def should_initialize_runtime():
     """Check if runtime should be initialized
@@ -86,6 +129,43 @@ def should_initialize_runtime():
     return env_val_lower not in ("0", "false", "no", "off")
 
 
+def should_connect_external_runtime():
+    """Check if a runtime-less run should attach to an external runtime
+
+    Reads CHI_EXTERNAL_RUNTIME; only "1"/"true"/"yes"/"on" opt in, so a
+    plain CHI_WITH_RUNTIME=0 run stays binding-only.
+    """
+    env_val = str(os.getenv("CHI_EXTERNAL_RUNTIME", "")).lower()
+    return env_val in ("1", "true", "yes", "on")
+
+
+def external_runtime_reachable(timeout=1.0):
+    """Return True if something accepts TCP connections on the runtime port
+
+    A cheap probe run before the client init, which can block or abort
+    when no runtime is listening.
+    """
+    port = os.getenv("CHI_PORT") or "9413"
+    try:
+        with socket.create_connection(("127.0.0.1", int(port)),
+                                      timeout=timeout):
+            return True
+    except (OSError, ValueError):
+        return False
+
+
+def prepend_ld_library_path(path):
+    """Prepend path to LD_LIBRARY_PATH and return the new value
+
+    An unset or empty LD_LIBRARY_PATH yields just path, never a trailing
+    ':' (which the loader would treat as the current directory).
+    """
+    prior = os.environ.get("LD_LIBRARY_PATH", "")
+    new_ld_path = f"{path}:{prior}" if prior else path
+    os.environ["LD_LIBRARY_PATH"] = new_ld_path
+    return new_ld_path
+
+
 def setup_environment_paths():
     """Set up CHI_REPO_PATH and LD_LIBRARY_PATH for ChiMod discovery (following C++ test pattern)
     
@@ -105,14 +185,10 @@ def setup_environment_paths():
             os.environ["CHI_REPO_PATH"] = bin_dir
             
             # Update LD_LIBRARY_PATH, preserving existing path
-            existing_ld_path = os.getenv("LD_LIBRARY_PATH", "")
-            if existing_ld_path:
-                os.environ["LD_LIBRARY_PATH"] = f"{bin_dir}:{existing_ld_path}"
-            else:
-                os.environ["LD_LIBRARY_PATH"] = bin_dir
+            new_ld_path = prepend_ld_library_path(bin_dir)
             
             print(f"   Set CHI_REPO_PATH={bin_dir}")
-            print(f"   Set LD_LIBRARY_PATH={os.environ['LD_LIBRARY_PATH']}")
+            print(f"   Set LD_LIBRARY_PATH={new_ld_path}")
             return True
     except Exception as e:
         print(f"   ⚠️  Could not determine module path: {e}")
@@ -120,23 +196,51 @@ def setup_environment_paths():
         cwd = os.getcwd()
         if os.path.exists(cwd):
             os.environ["CHI_REPO_PATH"] = cwd
-            existing_ld_path = os.getenv("LD_LIBRARY_PATH", "")
-            if existing_ld_path:
-                os.environ["LD_LIBRARY_PATH"] = f"{cwd}:{existing_ld_path}"
-            else:
-                os.environ["LD_LIBRARY_PATH"] = cwd
+            prepend_ld_library_path(cwd)
             print(f"   Set CHI_REPO_PATH={cwd} (fallback)")
             return True
     return False
 
 
+def connect_external_runtime(cte):
+    """Attach to an already-running runtime as a client only
+
+    Used when CHI_WITH_RUNTIME disables in-process runtime startup and
+    CHI_EXTERNAL_RUNTIME opts in, so repeated test runs reuse one long-lived
+    runtime instead of paying the full runtime bring-up each time. Uses
+    CHI_SERVER_CONF if set.
+
+    Returns:
+        True if the client and CTE subsystem are ready, False otherwise
+    """
+    global client_initialized
+
+    try:
+        if not cte.chimaera_init(cte.ChimaeraMode.kClient, False):
+            print("⚠️  Could not connect to an external runtime")
+            return False
+        client_initialized = True
+
+        config_path = os.getenv("CHI_SERVER_CONF", "")
+        if not cte.initialize_cte(config_path, cte.PoolQuery.Dynamic()):
+            print("⚠️  CTE initialization against external runtime failed")
+            return False
+    except Exception as e:
+        print(f"⚠️  External runtime connection failed: {e}")
+        return False
+
+    print("✅ Connected to external runtime")
+    return True
+
+
 def generate_test_config():
     """Generate a minimal test configuration for Chimaera runtime
 
     Example: Configuration File Structure
     ------------------------------------
     This demonstrates how to create a Chimaera configuration file programmatically.
-    The configuration is written as YAML and should contain:
+    The configuration is written as JSON (a subset of YAML, so the runtime's
+    YAML parser loads it as-is) and should contain:
     
     - networking: Protocol, hostfile, and port settings
     - workers: Number of worker threads
@@ -166,42 +270,33 @@ def generate_test_config():
             ]
         }
     
-    Creates a YAML config file with proper networking and storage settings.
+    Creates a config file with proper networking and storage settings.
     Returns the path to the generated config file.
     """
+    global _test_config
     import tempfile
     import socket
 
-    def find_available_port(start_port=9129, end_port=9200):
-        """Find an available port in the given range"""
-        for port in range(start_port, end_port):
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                try:
-                    s.bind(('', port))
-                    return port
-                except OSError:
-                    continue
-        raise RuntimeError(f"No available ports in range {start_port}-{end_port}")
-
-    try:
-        import yaml
-    except ImportError:
-        print("⚠️  PyYAML not available - cannot generate config")
-        return None
+    def find_available_port():
+        """Let the kernel pick a free ephemeral port"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(('', 0))
+            return s.getsockname()[1]
 
     temp_dir = tempfile.gettempdir()
 
     # Create clean hostfile
-    clean_hostfile = os.path.join(temp_dir, "wrp_bindings_test_hostfile")
-    with open(clean_hostfile, 'w') as f:
-        f.write("localhost\n")
+    clean_hostfile = f"{temp_dir}/wrp_bindings_test_hostfile"
+    with open(clean_hostfile, 'wb') as f:
+        f.write(b"localhost\n")
 
     # Find available port
     port = find_available_port()
     print(f"   Using port: {port}")
 
     # Create storage directory
-    storage_dir = os.path.join(temp_dir, "cte_bindings_test_storage")
+    storage_dir = f"{temp_dir}/cte_bindings_test_storage"
     os.makedirs(storage_dir, exist_ok=True)
 
     # Generate config
@@ -228,9 +323,10 @@ def generate_test_config():
     }
 
     # Write config
-    config_path = os.path.join(temp_dir, "wrp_bindings_test_conf.yaml")
-    with open(config_path, 'w') as f:
-        yaml.dump(config, f)
+    config_path = f"{temp_dir}/wrp_bindings_test_conf.yaml"
+    with open(config_path, 'wb') as f:
+        f.write(json.dumps(config).encode())
+    _test_config = config
 
     print(f"   Generated config: {config_path}")
 
@@ -296,9 +392,10 @@ def initialize_runtime_early(cte):
         # Step 1: Initialize Chimaera (unified init - both runtime and client)
         # Following pattern from test_chimaera_runtime.cc
         if not runtime_initialized or not client_initialized:
-            print("🔧 Initializing Chimaera (unified CHIMAERA_INIT)...")
-            print("   Note: If runtime isn't configured, this may cause FATAL and process exit")
-            sys.stdout.flush()  # Ensure output is flushed before potential abort
+            # One write + flush so the banner is visible before a potential abort
+            print("🔧 Initializing Chimaera (unified CHIMAERA_INIT)...\n"
+                  "   Note: If runtime isn't configured, this may cause FATAL and process exit",
+                  flush=True)
 
             try:
                 init_result = cte.chimaera_init(cte.ChimaeraMode.kClient, True)
@@ -317,20 +414,15 @@ def initialize_runtime_early(cte):
             client_initialized = True
 
             # Give Chimaera time to initialize all components (following C++ pattern: 500ms)
-            time.sleep(0.5)
-
-            # Verify initialization succeeded
-            print("✅ Chimaera initialized")
-            sys.stdout.flush()
+            time.sleep(CHI_INIT_DELAY)
 
-            # Verify client initialization (following C++ pattern that checks IPC)
-            # In C++ tests they verify: REQUIRE(CHI_IPC != nullptr) and REQUIRE(CHI_IPC->IsInitialized())
-            print("✅ Chimaera client initialized")
-            sys.stdout.flush()
+            # Verify initialization succeeded; client initialization follows the
+            # C++ pattern that checks IPC: REQUIRE(CHI_IPC != nullptr) and
+            # REQUIRE(CHI_IPC->IsInitialized()). Flushed with the next banner.
+            print("✅ Chimaera initialized\n✅ Chimaera client initialized")
 
         # Step 3: Initialize CTE subsystem (CTE-specific, not in base runtime tests)
-        print("🔧 Initializing CTE subsystem...")
-        sys.stdout.flush()
+        print("🔧 Initializing CTE subsystem...", flush=True)
 
         try:
             pool_query = cte.PoolQuery.Dynamic()
@@ -346,18 +438,14 @@ def initialize_runtime_early(cte):
             print("   Continuing with binding tests only...")
             return False
 
-        print("✅ CTE subsystem initialized")
-        sys.stdout.flush()
-        
         # Step 4: Register a storage target (required for PutBlob operations)
-        print("🔧 Registering storage target...")
+        print("✅ CTE subsystem initialized\n🔧 Registering storage target...",
+              flush=True)
         try:
             client = cte.get_cte_client()
 
-            # Get storage directory from config (or use a default)
-            import yaml
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            # Get storage directory from the generated config (or use a default)
+            config = _test_config or {}
             storage_dir = config.get('devices', [{}])[0].get('mount_point', '/tmp/cte_test_storage')
 
             # Create target path
@@ -391,7 +479,6 @@ def initialize_runtime_early(cte):
     except Exception as e:
         print(f"⚠️  Runtime initialization error: {e}")
         print("   Continuing with binding tests only...")
-        import traceback
         traceback.print_exc()
         sys.stdout.flush()
         return False
@@ -613,7 +700,6 @@ def test_context_delete_operation(cte):
                 
             except Exception as e:
                 print(f"   ⚠️  context_delete operation failed: {e}")
-                import traceback
                 traceback.print_exc()
         else:
             print("   ⚠️  DelBlob method not available on Client")
@@ -624,7 +710,6 @@ def test_context_delete_operation(cte):
         
     except Exception as e:
         print(f"⚠️  context_delete test error (may be expected): {e}")
-        import traceback
         traceback.print_exc()
         return True
 
@@ -731,7 +816,6 @@ def test_reorganize_blob(cte):
 
         except Exception as e:
             print(f"   ⚠️  ReorganizeBlob operation failed: {e}")
-            import traceback
             traceback.print_exc()
 
         print("✅ ReorganizeBlob test completed")
@@ -739,7 +823,6 @@ def test_reorganize_blob(cte):
 
     except Exception as e:
         print(f"⚠️  ReorganizeBlob test error: {e}")
-        import traceback
         traceback.print_exc()
         return True
 
@@ -867,22 +950,18 @@ def test_poll_telemetry_log(cte):
 
         except Exception as e:
             print(f"   ⚠️  PollTelemetryLog test failed: {e}")
-            import traceback
             traceback.print_exc()
             return True  # Don't fail the test - may be expected
 
     except Exception as e:
         print(f"⚠️  PollTelemetryLog test error (may be expected): {e}")
-        import traceback
         traceback.print_exc()
         return True
 
 
 def main():
     """Run all context operation tests"""
-    print("=" * 70)
-    print("🧪 Python Bindings Test Suite - MCP Integration Examples")
-    print("=" * 70)
+    print(BANNER.format("🧪 Python Bindings Test Suite - MCP Integration Examples"))
     print()
     
     # STEP 0: Runtime initialization (if enabled) - MUST BE FIRST before any client code
@@ -924,6 +1003,16 @@ def main():
     except ImportError as e:
         print(f"❌ Cannot import module: {e}")
         return 1
+
+    # Client-only path: reuse a runtime started outside this process, but
+    # only on request and only if one is actually listening
+    if not should_initialize_runtime() and should_connect_external_runtime():
+        if external_runtime_reachable():
+            runtime_ok = connect_external_runtime(cte)
+        else:
+            print("⚠️  CHI_EXTERNAL_RUNTIME set but no runtime is reachable "
+                  f"on port {os.getenv('CHI_PORT') or '9413'}")
+        print()
     
     # Test 1: Context bundle operation (context_bundle equivalent)
     if runtime_ok:
@@ -955,9 +1044,7 @@ def main():
         print()
     
     # Summary
-    print("=" * 70)
-    print("📊 Test Summary")
-    print("=" * 70)
+    print(BANNER.format("📊 Test Summary"))
     print("✅ All context operation tests completed")
     if runtime_ok:
         print("✅ Runtime tests executed")
@@ -965,7 +1052,7 @@ def main():
         print("⚠️  Runtime tests skipped (runtime not initialized)")
     print()
     print("🎉 Python bindings test suite passed!")
-    print("=" * 70)
+    print(SEP)
     
     return 0
 
@@ -978,6 +1065,5 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"\n\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
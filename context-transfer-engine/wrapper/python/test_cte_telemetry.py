@@ -26,6 +26,17 @@ import time
 # Add current directory to path for module import
 sys.path.insert(0, os.getcwd())
 
+# Seconds to wait after chimaera_init (CHI_INIT_DELAY, default 0.5); a
+# malformed or negative value keeps the default instead of failing here
+try:
+    CHI_INIT_DELAY = float(os.environ.get("CHI_INIT_DELAY") or 0.5)
+except ValueError:
+    CHI_INIT_DELAY = -1.0
+if not 0 <= CHI_INIT_DELAY < float("inf"):
+    print("Warning: ignoring invalid CHI_INIT_DELAY="
+          f"{os.environ.get('CHI_INIT_DELAY')!r}, using 0.5s", file=sys.stderr)
+    CHI_INIT_DELAY = 0.5
+
 # Try to import pytest, but make it optional
 try:
     import pytest
@@ -106,7 +117,7 @@ def runtime_initialized(cte_module):
             pytest.skip("Chimaera initialization failed")
 
         # Give runtime time to initialize
-        time.sleep(0.5)
+        time.sleep(CHI_INIT_DELAY)
 
         # Initialize CTE subsystem
         pool_query = cte_module.PoolQuery.Dynamic()
@@ -344,7 +355,7 @@ def main():
             print("❌ Chimaera initialization failed")
             return 1
 
-        time.sleep(0.5)
+        time.sleep(CHI_INIT_DELAY)
 
         pool_query = cte.PoolQuery.Dynamic()
         if not cte.initialize_cte(config_path, pool_query):
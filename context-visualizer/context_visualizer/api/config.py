@@ -26,7 +26,8 @@ def _load_config():
     for path in candidates:
         if path and os.path.isfile(path):
             with open(path) as fh:
-                return yaml.safe_load(fh)
+                return yaml.load(
+                    fh, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     return None
 
 
@@ -10,6 +10,9 @@
 #   ./install.sh conda        # Build with conda-optimized preset
 #   ./install.sh cuda         # Build with CUDA preset
 #   ./install.sh rocm         # Build with ROCm preset
+#
+# conda-build output is written to build/conda-output/conda-build.log and
+# only shown on failure; set IOWARP_BUILD_VERBOSE=1 to stream it instead.
 
 set -e  # Exit on error
 
@@ -169,7 +172,9 @@ fi
 # Initialize and update git submodules recursively (if in a git repository)
 if [ -d ".git" ]; then
     echo -e "${BLUE}>>> Initializing git submodules...${NC}"
-    git submodule update --init --recursive 2>/dev/null || {
+    # Fetch submodules in parallel (nproc on Linux, hw.ncpu on macOS)
+    SUBMODULE_JOBS=$(nproc 2>/dev/null || sysctl -n hw.ncpu 2>/dev/null || echo 4)
+    git submodule update --init --recursive --jobs "$SUBMODULE_JOBS" 2>/dev/null || {
         echo -e "${YELLOW}Some submodules failed to update (worktrees or optional repos). Continuing...${NC}"
     }
     echo ""
@@ -200,14 +205,31 @@ export IOWARP_PRESET="$PRESET"
 TARGET_PYTHON="$(python3 -c 'import sys; print(f"{sys.version_info.major}.{sys.version_info.minor}")')"
 echo -e "${BLUE}Target Python version: $TARGET_PYTHON${NC}"
 
-if conda build "$RECIPE_DIR" \
-    --output-folder "$OUTPUT_DIR" \
-    -c conda-forge \
-    --python="$TARGET_PYTHON" \
-    --no-anaconda-upload; then
-    BUILD_SUCCESS=true
+run_conda_build() {
+    conda build "$RECIPE_DIR" \
+        --output-folder "$OUTPUT_DIR" \
+        -c conda-forge \
+        --python="$TARGET_PYTHON" \
+        --no-anaconda-upload
+}
+
+# Verbose builds stream to the terminal untouched; redirecting them would
+# reopen (and truncate) stdout if it is already a file
+BUILD_VERBOSE="${IOWARP_BUILD_VERBOSE:-0}"
+BUILD_LOG="$OUTPUT_DIR/conda-build.log"
+if [ "$BUILD_VERBOSE" = "1" ]; then
+    if run_conda_build; then
+        BUILD_SUCCESS=true
+    else
+        BUILD_SUCCESS=false
+    fi
 else
-    BUILD_SUCCESS=false
+    echo -e "${BLUE}Build log: $BUILD_LOG${NC}"
+    if run_conda_build > "$BUILD_LOG" 2>&1; then
+        BUILD_SUCCESS=true
+    else
+        BUILD_SUCCESS=false
+    fi
 fi
 
 echo ""
@@ -260,6 +282,11 @@ else
     echo -e "Build failed!"
     echo -e "======================================================================${NC}"
     echo ""
+    if [ "$BUILD_VERBOSE" != "1" ]; then
+        echo -e "${YELLOW}Last 50 lines of $BUILD_LOG:${NC}"
+        tail -n 50 "$BUILD_LOG"
+        echo ""
+    fi
     echo -e "${YELLOW}Troubleshooting steps:${NC}"
     echo ""
     echo "1. Check that submodules are initialized:"
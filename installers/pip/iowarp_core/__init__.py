@@ -37,7 +37,9 @@ def _setup():
     # Add lib/ to LD_LIBRARY_PATH so dlopen finds IOWarp shared libs
     if os.path.isdir(_LIB_DIR):
         ld_path = os.environ.get("LD_LIBRARY_PATH", "")
-        if _LIB_DIR not in ld_path:
+        # Compare whole entries: a substring test would treat lib/ as
+        # present when only e.g. lib64/ is on the path
+        if _LIB_DIR not in ld_path.split(os.pathsep):
             os.environ["LD_LIBRARY_PATH"] = (
                 _LIB_DIR + ":" + ld_path if ld_path else _LIB_DIR
             )
@@ -45,7 +45,7 @@ def main():
 
     # Ensure IOWarp libs are on the library path
     ld_path = os.environ.get("LD_LIBRARY_PATH", "")
-    if lib_dir not in ld_path:
+    if lib_dir not in ld_path.split(os.pathsep):
         os.environ["LD_LIBRARY_PATH"] = (
             lib_dir + ":" + ld_path if ld_path else lib_dir
         )
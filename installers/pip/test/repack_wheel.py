@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Repack a wheel directory into a .whl file, preserving Unix permissions."""
 import os
+import shutil
 import sys
 import zipfile
 
@@ -15,8 +16,11 @@ def repack(whl_path, base_dir):
                 st = os.stat(full)
                 # Preserve Unix permissions (especially execute bit)
                 info.external_attr = (st.st_mode & 0xFFFF) << 16
-                with open(full, "rb") as fh:
-                    zf.writestr(info, fh.read())
+                # Stream in chunks so large shared libraries are never held
+                # in memory whole; file_size lets zipfile pick zip64 upfront
+                info.file_size = st.st_size
+                with open(full, "rb") as src, zf.open(info, "w") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
 
 
 if __name__ == "__main__":
@@ -10,6 +10,9 @@ import pathlib
 import os
 import yaml
 
+# libyaml-backed dumper when PyYAML was built with it, else the pure-Python one
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class WrpAdapters(Interceptor):
     """
@@ -325,7 +328,8 @@ class WrpAdapters(Interceptor):
 
         try:
             with open(self.cae_config_path, 'w') as f:
-                yaml.dump(cae_config, f, default_flow_style=False, indent=2)
+                yaml.dump(cae_config, f, Dumper=_YAML_DUMPER,
+                          default_flow_style=False, indent=2)
 
             # Set environment variable immediately after creating config file
             self.env['WRP_CAE_CONF'] = self.cae_config_path
@@ -12,6 +12,9 @@ import yaml
 import os
 import re
 
+# libyaml-backed dumper when PyYAML was built with it, else the pure-Python one
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 class WrpCte(Service):
     """
@@ -148,7 +151,8 @@ class WrpCte(Service):
 
         with open(self.compose_config_path, 'w') as f:
             f.write('# Content Transfer Engine (CTE) Compose Configuration\n\n')
-            yaml.dump(compose_config, f, default_flow_style=False, indent=2)
+            yaml.dump(compose_config, f, Dumper=_YAML_DUMPER,
+                      default_flow_style=False, indent=2)
 
         # Create device directories (skip RAM devices)
         for path, _, _ in devices:
@@ -298,7 +298,8 @@ class WrpCteGpuBench(Application):
 
         # Load results from YAML
         with open(results_yaml, 'r') as f:
-            data = _yaml.safe_load(f)
+            data = _yaml.load(
+                f, Loader=getattr(_yaml, 'CSafeLoader', _yaml.SafeLoader))
 
         if not data or 'results' not in data:
             return
@@ -10,10 +10,13 @@ from jarvis_cd.shell.process import Kill, GdbServer
 from jarvis_cd.util import SizeType
 from jarvis_cd.util.logger import Color
 import os
-import subprocess
+import socket
 import time
 import yaml
 
+# libyaml-backed dumper when PyYAML was built with it, else the pure-Python one
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 # Shared snippet: install all IOWarp build deps + build IOWarp from source
 # on a bare ubuntu:24.04. Used by wrp_runtime and adios2_gray_scott build phases.
 IOWARP_BUILD_DEPS = r"""
@@ -156,7 +159,8 @@ def iowarp_clone_and_build(branch: str, preset: str) -> str:
     """
     return rf"""
 # Clone and build IOWarp ({branch} @ preset: {preset})
-RUN git clone --recurse-submodules --depth 1 --branch {branch} \
+RUN git clone --recurse-submodules --jobs $(nproc) \
+    --depth 1 --branch {branch} \
     https://github.com/iowarp/clio-core.git /opt/iowarp
 
 WORKDIR /opt/iowarp
@@ -399,12 +403,22 @@ CMD ["/bin/bash"]
 
         with open(self.config_file, 'w') as f:
             f.write('# Chimaera Runtime Configuration\n\n')
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_dict, f, Dumper=_YAML_DUMPER,
+                      default_flow_style=False, sort_keys=False)
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _port_open(host, port, timeout=2):
+        """Return True if a TCP connection to host:port succeeds."""
+        try:
+            with socket.create_connection((host, int(port)), timeout=timeout):
+                return True
+        except OSError:
+            return False
+
     def start(self):
         self.log("Starting IOWarp runtime")
         cmd = 'chimaera runtime start'
@@ -436,14 +450,8 @@ CMD ["/bin/bash"]
         host = self.jarvis.hostfile.hosts[0] if self.jarvis.hostfile.hosts else '127.0.0.1'
         self.log(f'Waiting for runtime on {host}:{port}', color=Color.YELLOW)
         for i in range(30):
-            try:
-                ret = subprocess.run(
-                    ['bash', '-c', f'echo > /dev/tcp/{host}/{port}'],
-                    capture_output=True, timeout=2)
-                if ret.returncode == 0:
-                    break
-            except subprocess.TimeoutExpired:
-                pass
+            if self._port_open(host, port):
+                break
             time.sleep(1)
         else:
             self.log(f'WARNING: Runtime did not respond on {host}:{port} after 30s',
@@ -471,13 +479,7 @@ CMD ["/bin/bash"]
         port = self.config['port']
         host = self.jarvis.hostfile.hosts[0] if self.jarvis.hostfile.hosts else '127.0.0.1'
         for i in range(10):
-            try:
-                ret = subprocess.run(
-                    ['bash', '-c', f'echo > /dev/tcp/{host}/{port}'],
-                    capture_output=True, timeout=2)
-                if ret.returncode != 0:
-                    break
-            except subprocess.TimeoutExpired:
+            if not self._port_open(host, port):
                 break
             time.sleep(1)
         time.sleep(1)